@@ -0,0 +1,97 @@
+import argparse
+import time
+
+from src.backends import available_backends, set_backend
+from src.bls12_381 import (
+    G1Point,
+    G2Point,
+    PreparedG2,
+    decompression_cache,
+    msm,
+    pairing_product_is_one,
+    rng,
+)
+from src.commitment import Commitment
+from src.range import Range
+
+
+def timed(fn, repeat: int) -> float:
+    # the best of a few runs in milliseconds, after one warm up call
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmarks(repeat: int) -> dict[str, float]:
+    g1 = G1Point.generator() * rng()
+    g2 = G2Point.generator() * rng()
+    blob1 = g1.to_bytes()
+    blob2 = g2.to_bytes()
+    scalar = rng()
+    points = [G1Point.generator() * rng() for _ in range(64)]
+    scalars = [rng() for _ in range(64)]
+    q = PreparedG2(G2Point.generator())
+    proof = Range(42, 0, 100).generate_proof()
+    return {
+        "g1 scalar mul": timed(lambda: g1 * scalar, repeat),
+        "g2 scalar mul": timed(lambda: g2 * scalar, repeat),
+        "g1 add": timed(lambda: g1 + g1, repeat),
+        "g1 compress": timed(lambda: G1Point(g1.pt, g1.ops).to_bytes(), repeat),
+        "g1 decompress": timed(lambda: G1Point.from_bytes(blob1), repeat),
+        "g2 decompress": timed(lambda: G2Point.from_bytes(blob2), repeat),
+        "g1 msm 64": timed(lambda: msm(points, scalars), repeat),
+        "pairing product": timed(
+            lambda: pairing_product_is_one([(q, g1), (q, -g1)]), repeat
+        ),
+        "commitment": timed(lambda: Commitment(42), repeat),
+        "generate proof": timed(lambda: Range(42, 0, 100).generate_proof(), repeat),
+        "verify proof": timed(lambda: Range.verify_proof(proof, 0, 100), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time the curve operations and the prover on every backend.\n\n"
+            "Example:\n"
+            "python3 benchmark.py\n"
+            "python3 benchmark.py --backend python --backend py_ecc --repeat 5"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        action="append",
+        choices=available_backends(),
+        help="A backend to time, every available backend by default",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of timed runs per operation",
+    )
+    args = parser.parse_args()
+    names = args.backend or available_backends()
+
+    # decompression is timed, not the cache
+    decompression_cache.resize(0)
+    results = {}
+    for name in names:
+        set_backend(name)
+        results[name] = benchmarks(args.repeat)
+
+    print(f"{'ms':<18}" + "".join(f"{name:>12}" for name in names))
+    for operation in results[names[0]]:
+        row = "".join(f"{results[name][operation]:>12.3f}" for name in names)
+        print(f"{operation:<18}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import importlib
+import os
+
+
+class GroupOps:
+    """
+    Group arithmetic for one of the BLS12-381 groups in one representation.
+
+    A point is an opaque projective value that only the GroupOps that made it
+    understands. Points move between representations through the py_ecc
+    projective tuples, which every backend can read and write.
+
+    Attributes:
+        zero: The point at infinity.
+        generator: The group generator.
+        size (int): The length of a compressed point in bytes.
+        native_msm (bool): Whether msm is implemented by the backend itself
+            instead of the generic Straus and Pippenger code.
+    """
+
+    zero: tuple
+    generator: tuple
+    size: int
+    native_msm = False
+
+    def add(self, p: tuple, q: tuple) -> tuple:
+        raise NotImplementedError
+
+    def double(self, p: tuple) -> tuple:
+        raise NotImplementedError
+
+    def neg(self, p: tuple) -> tuple:
+        raise NotImplementedError
+
+    def multiply(self, p: tuple, scalar: int) -> tuple:
+        raise NotImplementedError
+
+    def msm(self, points: list[tuple], scalars: list[int]) -> tuple:
+        raise NotImplementedError
+
+    def split_scalars(
+        self, points: list[tuple], scalars: list[int]
+    ) -> tuple[list[tuple], list[int]]:
+        # an endomorphism can trade each scalar for two shorter ones
+        return points, scalars
+
+    def eq(self, p: tuple, q: tuple) -> bool:
+        raise NotImplementedError
+
+    def is_inf(self, p: tuple) -> bool:
+        raise NotImplementedError
+
+    def encode(self, p: tuple) -> bytes:
+        raise NotImplementedError
+
+    def encode_many(self, points: list[tuple]) -> list[bytes]:
+        return [self.encode(p) for p in points]
+
+    def decode(self, data: bytes, validate: bool = True) -> tuple:
+        # validate=False may skip any check that decompression does not need
+        raise NotImplementedError
+
+    def in_subgroup(self, p: tuple) -> bool:
+        raise NotImplementedError
+
+    def check_size(self, data: bytes) -> None:
+        # padded or truncated encodings would otherwise decode as integers
+        if len(data) != self.size:
+            raise ValueError(
+                f"A compressed point must be {self.size} bytes, got {len(data)}"
+            )
+
+    def normalize_many(self, points: list[tuple]) -> list[tuple]:
+        return points
+
+    def affine(self, p: tuple) -> tuple | None:
+        raise NotImplementedError
+
+    def to_reference(self, p: tuple) -> tuple:
+        raise NotImplementedError
+
+    def from_reference(self, p: tuple) -> tuple:
+        raise NotImplementedError
+
+
+class Backend:
+    """
+    A named pair of G1 and G2 group arithmetic implementations.
+
+    Pairings are computed by the shared Miller loop code on affine coordinates
+    unless the backend sets native_pairing and computes pairing products on its
+    own points.
+
+    Attributes:
+        name (str): The name the backend is selected by.
+        g1 (GroupOps): The G1 arithmetic.
+        g2 (GroupOps): The G2 arithmetic.
+        native_pairing (bool): Whether pairing_product_is_one is implemented.
+    """
+
+    native_pairing = False
+
+    def __init__(self, name: str, g1: GroupOps, g2: GroupOps) -> None:
+        self.name = name
+        self.g1 = g1
+        self.g2 = g2
+
+    def pairing_product_is_one(self, pairs: list[tuple[tuple, tuple]]) -> bool:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"Backend({self.name})"
+
+
+# the environment variable that picks the backend at startup
+BACKEND_ENV = "RANGE_PROOF_BACKEND"
+
+_registry: dict[str, Backend] = {}
+_active: Backend | None = None
+
+
+# the built-in backends by name, imported the first time they are asked for
+_builtin = {
+    "python": "src.backends.optimized",
+    "py_ecc": "src.backends.reference",
+    "arkworks": "src.backends.arkworks",
+}
+# accelerated libraries are optional, they can be selected when installed
+_optional = {"arkworks"}
+
+
+def _load(name: str) -> Backend | None:
+    if name not in _registry and name in _builtin:
+        try:
+            module = importlib.import_module(_builtin[name])
+        except ImportError:
+            if name not in _optional:
+                raise
+            return None
+        _registry.setdefault(name, module.backend)
+    return _registry.get(name)
+
+
+def register_backend(backend: Backend) -> None:
+    """
+    Adds a backend to the registry so that it can be selected by name.
+
+    Args:
+        backend (Backend): The backend, replacing any with the same name.
+    """
+    _registry[backend.name] = backend
+
+
+def available_backends() -> list[str]:
+    """
+    Lists the backends that can be selected in this environment.
+
+    Returns:
+        list[str]: The backend names, detected accelerated libraries included.
+    """
+    for name in _builtin:
+        _load(name)
+    return list(_registry)
+
+
+def default_backend() -> str:
+    """
+    Picks the backend to start with.
+
+    The environment variable RANGE_PROOF_BACKEND wins when it is set. Otherwise
+    it is the pure-Python code. Accelerated libraries are registered when they
+    are installed but are only used when selected by name, as they have not
+    been through the conformance tests in this tree.
+
+    Returns:
+        str: The name of the default backend.
+    """
+    return os.environ.get(BACKEND_ENV) or "python"
+
+
+def get_backend() -> Backend:
+    """
+    Returns the backend that new points are created with.
+
+    Returns:
+        Backend: The active backend, the default one until set_backend is called.
+    """
+    if _active is None:
+        set_backend(default_backend())
+    return _active
+
+
+def set_backend(name: str) -> Backend:
+    """
+    Selects the backend that new points are created with.
+
+    Points that already exist keep their backend, and mixing points from two
+    backends converts the other point on the fly.
+
+    Args:
+        name (str): A name from available_backends, e.g. "python" or "py_ecc".
+
+    Returns:
+        Backend: The newly active backend.
+    """
+    global _active
+    backend = _load(name)
+    if backend is None:
+        raise ValueError(f"Unknown backend: {name}")
+    _active = backend
+    return _active
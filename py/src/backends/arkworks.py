@@ -0,0 +1,107 @@
+from py_arkworks_bls12381 import GT, Scalar
+from py_arkworks_bls12381 import G1Point as ArkG1
+from py_arkworks_bls12381 import G2Point as ArkG2
+
+from src.backends import Backend, GroupOps
+from src.backends import optimized, reference
+
+
+def _scalar(value: int) -> Scalar:
+    return Scalar.from_le_bytes(value.to_bytes(32, "little"))
+
+
+class _ArkworksGroup(GroupOps):
+    # arkworks points through py_arkworks_bls12381, conversions go through the
+    # compressed encoding which both sides agree on
+    native_msm = True
+
+    point_type: type
+
+    def add(self, p, q):
+        return p + q
+
+    def double(self, p):
+        return p + p
+
+    def neg(self, p):
+        return -p
+
+    def multiply(self, p, scalar: int):
+        return p * _scalar(scalar)
+
+    def msm(self, points: list, scalars: list[int]):
+        return self.point_type.multiexp_unchecked(
+            points, [_scalar(scalar) for scalar in scalars]
+        )
+
+    def eq(self, p, q) -> bool:
+        return p == q
+
+    def is_inf(self, p) -> bool:
+        return p == self.zero
+
+    def encode(self, p) -> bytes:
+        return bytes(p.to_compressed_bytes())
+
+    def decode(self, data: bytes, validate: bool = True):
+        self.check_size(data)
+        if not validate:
+            try:
+                return self.point_type.from_compressed_bytes_unchecked(data)
+            except Exception as error:
+                raise ValueError(str(error)) from error
+        try:
+            # the checked decoder also tests subgroup membership
+            return self.point_type.from_compressed_bytes(data)
+        except Exception:
+            # the pure-Python decoder raises the reference error for a bad
+            # encoding, a point on the curve but outside the subgroup is left
+            # to in_subgroup like on every other backend
+            self._python.decode(data)
+            return self.point_type.from_compressed_bytes_unchecked(data)
+
+    def in_subgroup(self, p) -> bool:
+        try:
+            self.point_type.from_compressed_bytes(self.encode(p))
+        except Exception:
+            return False
+        return True
+
+    def affine(self, p) -> tuple | None:
+        return self._python.affine(self._python.decode(self.encode(p)))
+
+    def to_reference(self, p) -> tuple:
+        return self._reference.decode(self.encode(p))
+
+    def from_reference(self, p: tuple):
+        return self.decode(self._reference.encode(p))
+
+
+class ArkworksG1(_ArkworksGroup):
+    point_type = ArkG1
+    zero = ArkG1.identity()
+    generator = ArkG1()
+    size = 48
+    _python = optimized.backend.g1
+    _reference = reference.backend.g1
+
+
+class ArkworksG2(_ArkworksGroup):
+    point_type = ArkG2
+    zero = ArkG2.identity()
+    generator = ArkG2()
+    size = 96
+    _python = optimized.backend.g2
+    _reference = reference.backend.g2
+
+
+class ArkworksBackend(Backend):
+    native_pairing = True
+
+    def pairing_product_is_one(self, pairs: list[tuple]) -> bool:
+        g2s = [g2 for g2, _ in pairs]
+        g1s = [g1 for _, g1 in pairs]
+        return GT.multi_pairing(g1s, g2s) == GT.identity()
+
+
+backend = ArkworksBackend("arkworks", ArkworksG1(), ArkworksG2())
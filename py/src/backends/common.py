@@ -0,0 +1,56 @@
+from py_ecc.optimized_bls12_381 import field_modulus
+
+
+def batch_inverse(values: list[int]) -> list[int]:
+    """
+    Inverts many field elements with Montgomery's trick, one modular inversion
+    and three multiplications per element.
+
+    Args:
+        values (list[int]): Nonzero field elements.
+
+    Returns:
+        list[int]: The inverses, in input order.
+    """
+    q = field_modulus
+    prefix = []
+    acc = 1
+    for value in values:
+        prefix.append(acc)
+        acc = acc * value % q
+    inverse = pow(acc, -1, q)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = prefix[i] * inverse % q
+        inverse = inverse * values[i] % q
+    return inverses
+
+
+def wnaf(scalar: int, width: int) -> list[int]:
+    """
+    The width-w non-adjacent form of a scalar, least significant digit first.
+
+    Every nonzero digit is odd and below 2^(w - 1) in absolute value, and any
+    w consecutive digits hold at most one nonzero digit.
+
+    Args:
+        scalar (int): A non-negative scalar.
+        width (int): The window width w.
+
+    Returns:
+        list[int]: The signed digits.
+    """
+    digits = []
+    modulus = 1 << width
+    half = modulus >> 1
+    while scalar:
+        if scalar & 1:
+            digit = scalar & (modulus - 1)
+            if digit >= half:
+                digit -= modulus
+            scalar -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        scalar >>= 1
+    return digits
@@ -0,0 +1,547 @@
+from py_ecc.bls.constants import (
+    EIGHTH_ROOTS_OF_UNITY,
+    FQ2_ORDER,
+    POW_2_381,
+    POW_2_382,
+    POW_2_383,
+)
+from py_ecc.fields import optimized_bls12_381_FQ as FQ
+from py_ecc.fields import optimized_bls12_381_FQ2 as FQ2
+from py_ecc.optimized_bls12_381 import G1, G2, curve_order, field_modulus
+
+from src.backends import Backend, GroupOps
+from src.backends.common import batch_inverse, wnaf
+
+q = field_modulus
+
+#
+# FQ2 on (real, imaginary) int pairs, i^2 = -1
+#
+
+
+def f2_add(a: tuple, b: tuple) -> tuple:
+    return (a[0] + b[0]) % q, (a[1] + b[1]) % q
+
+
+def f2_sub(a: tuple, b: tuple) -> tuple:
+    return (a[0] - b[0]) % q, (a[1] - b[1]) % q
+
+
+def f2_mul(a: tuple, b: tuple) -> tuple:
+    a0, a1 = a
+    b0, b1 = b
+    t0 = a0 * b0
+    t1 = a1 * b1
+    return (t0 - t1) % q, ((a0 + a1) * (b0 + b1) - t0 - t1) % q
+
+
+def f2_sqr(a: tuple) -> tuple:
+    a0, a1 = a
+    return (a0 + a1) * (a0 - a1) % q, 2 * a0 * a1 % q
+
+
+def f2_scale(a: tuple, k: int) -> tuple:
+    return a[0] * k % q, a[1] * k % q
+
+
+def f2_inv(a: tuple) -> tuple:
+    a0, a1 = a
+    norm_inverse = pow(a0 * a0 + a1 * a1, -1, q)
+    return a0 * norm_inverse % q, -a1 * norm_inverse % q
+
+
+def f2_pow(a: tuple, exponent: int) -> tuple:
+    result = (1, 0)
+    for bit in bin(exponent)[2:]:
+        result = f2_sqr(result)
+        if bit == "1":
+            result = f2_mul(result, a)
+    return result
+
+
+F2_ONE = (1, 0)
+F2_ZERO = (0, 0)
+B2 = (4, 4)
+EIGHTH_ROOTS = [tuple(root.coeffs) for root in EIGHTH_ROOTS_OF_UNITY]
+
+# the constants of the psi endomorphism of G2, 1 / (1 + i)^((q - 1) / 3) and
+# 1 / (1 + i)^((q - 1) / 2)
+PSI_X = f2_inv(f2_pow((1, 1), (q - 1) // 3))
+PSI_Y = f2_inv(f2_pow((1, 1), (q - 1) // 2))
+
+
+def f2_sqrt(a: tuple) -> tuple | None:
+    # the same root selection as py_ecc's modular_squareroot_in_FQ2
+    candidate = f2_pow(a, (FQ2_ORDER + 8) // 16)
+    check = f2_mul(f2_sqr(candidate), f2_inv(a))
+    if check not in EIGHTH_ROOTS[::2]:
+        return None
+    x1 = f2_mul(candidate, f2_inv(EIGHTH_ROOTS[EIGHTH_ROOTS.index(check) // 2]))
+    x2 = (-x1[0] % q, -x1[1] % q)
+    return x1 if (x1[1] > x2[1] or (x1[1] == x2[1] and x1[0] > x2[0])) else x2
+
+
+def _flags(z: int) -> tuple[bool, bool, bool]:
+    return bool((z >> 383) & 1), bool((z >> 382) & 1), bool((z >> 381) & 1)
+
+
+def _window_multiply(ops: GroupOps, p: tuple, scalar: int) -> tuple:
+    # left to right fixed 4-bit windows
+    if scalar == 0 or ops.is_inf(p):
+        return ops.zero
+    add = ops.add
+    double = ops.double
+    table = [ops.zero, p]
+    for _ in range(14):
+        table.append(add(table[-1], p))
+    acc = ops.zero
+    started = False
+    for shift in range((scalar.bit_length() - 1) // 4 * 4, -1, -4):
+        if started:
+            acc = double(double(double(double(acc))))
+        digit = (scalar >> shift) & 15
+        if digit:
+            acc = add(acc, table[digit])
+            started = True
+    return acc
+
+
+# the GLV endomorphism of G1, (x, y) -> (BETA x, y) is multiplication by LAMBDA,
+# and LAMBDA = z^2 - 1 for the curve parameter z so that
+# LAMBDA^2 + LAMBDA + 1 == curve_order
+BETA = 0x1A0111EA397FE699EC02408663D4DE85AA0D857D89759AD4897D29650FB85F9B409427EB4F49FFFD8BFD00000000AAAC
+LAMBDA = 0xAC45A4010001A40200000000FFFFFFFF
+
+# the curve parameter is z = -Z_ABS
+Z_ABS = 0xD201000000010000
+
+
+def _double_and_add(ops: GroupOps, p: tuple, scalar: int) -> tuple:
+    # for short sparse scalars like Z_ABS, no table and no reduction
+    acc = ops.zero
+    for bit in bin(scalar)[2:]:
+        acc = ops.double(acc)
+        if bit == "1":
+            acc = ops.add(acc, p)
+    return acc
+
+
+def glv_decompose(scalar: int) -> tuple[int, int]:
+    """
+    Splits a scalar into k1 + k2 * LAMBDA with both halves about 128 bits.
+
+    LAMBDA is about the square root of the curve order, so plain division
+    already gives a short decomposition without any lattice reduction.
+
+    Args:
+        scalar (int): The scalar.
+
+    Returns:
+        tuple[int, int]: The non-negative halves (k1, k2).
+    """
+    k2, k1 = divmod(scalar % curve_order, LAMBDA)
+    return k1, k2
+
+
+class IntG1(GroupOps):
+    """
+    G1 in Jacobian coordinates (x = X / Z^2, y = Y / Z^3) on plain ints, with
+    the a = 0 doubling and addition formulas and a mixed addition for Z = 1.
+    """
+
+    zero = (1, 1, 0)
+    generator = (G1[0].n, G1[1].n, 1)
+    size = 48
+
+    def add(self, p1: tuple, p2: tuple) -> tuple:
+        X1, Y1, Z1 = p1
+        X2, Y2, Z2 = p2
+        if Z1 == 0:
+            return p2
+        if Z2 == 0:
+            return p1
+        Z1Z1 = Z1 * Z1 % q
+        if Z2 == 1:
+            # madd-2007-bl
+            U1 = X1
+            S1 = Y1
+            U2 = X2 * Z1Z1 % q
+            S2 = Y2 * Z1 * Z1Z1 % q
+        else:
+            # add-2007-bl
+            Z2Z2 = Z2 * Z2 % q
+            U1 = X1 * Z2Z2 % q
+            S1 = Y1 * Z2 * Z2Z2 % q
+            U2 = X2 * Z1Z1 % q
+            S2 = Y2 * Z1 * Z1Z1 % q
+        H = (U2 - U1) % q
+        r = 2 * (S2 - S1) % q
+        if H == 0:
+            if r == 0:
+                return self.double(p1)
+            return self.zero
+        I = 4 * H * H % q  # noqa: E741
+        J = H * I % q
+        V = U1 * I % q
+        X3 = (r * r - J - 2 * V) % q
+        Y3 = (r * (V - X3) - 2 * S1 * J) % q
+        if Z2 == 1:
+            Z3 = 2 * Z1 * H % q
+        else:
+            Z3 = 2 * Z1 * Z2 * H % q
+        return X3, Y3, Z3
+
+    def double(self, p: tuple) -> tuple:
+        # dbl-2009-l
+        X, Y, Z = p
+        if Z == 0:
+            return p
+        A = X * X % q
+        B = Y * Y % q
+        C = B * B % q
+        D = 2 * ((X + B) * (X + B) - A - C) % q
+        E = 3 * A
+        X3 = (E * E - 2 * D) % q
+        Y3 = (E * (D - X3) - 8 * C) % q
+        Z3 = 2 * Y * Z % q
+        return X3, Y3, Z3
+
+    def neg(self, p: tuple) -> tuple:
+        X, Y, Z = p
+        return X, -Y % q, Z
+
+    def endomorphism(self, p: tuple) -> tuple:
+        X, Y, Z = p
+        return BETA * X % q, Y, Z
+
+    def multiply(self, p: tuple, scalar: int) -> tuple:
+        # GLV, k P = k1 P + k2 phi(P) in one joint wNAF walk over ~128 bits
+        scalar %= curve_order
+        if scalar == 0 or p[2] == 0:
+            return self.zero
+        k1, k2 = glv_decompose(scalar)
+        width = 5
+        # odd multiples P, 3P, ..., 15P, normalized for mixed additions
+        p2 = self.double(p)
+        odd = [p]
+        for _ in range((1 << (width - 2)) - 1):
+            odd.append(self.add(odd[-1], p2))
+        odd = self.normalize_many(odd)
+        tables = []
+        for points in (odd, [self.endomorphism(pt) for pt in odd]):
+            tables.append((points, [self.neg(pt) for pt in points]))
+        digits = (wnaf(k1, width), wnaf(k2, width))
+        add = self.add
+        double = self.double
+        acc = self.zero
+        for i in range(max(len(digits[0]), len(digits[1])) - 1, -1, -1):
+            acc = double(acc)
+            for naf, (positive, negative) in zip(digits, tables):
+                if i < len(naf) and naf[i]:
+                    digit = naf[i]
+                    if digit > 0:
+                        acc = add(acc, positive[digit >> 1])
+                    else:
+                        acc = add(acc, negative[-digit >> 1])
+        return acc
+
+    def split_scalars(
+        self, points: list[tuple], scalars: list[int]
+    ) -> tuple[list[tuple], list[int]]:
+        split_points = []
+        split_scalars = []
+        for p, scalar in zip(points, scalars):
+            k1, k2 = glv_decompose(scalar)
+            split_points += [p, self.endomorphism(p)]
+            split_scalars += [k1, k2]
+        return split_points, split_scalars
+
+    def in_subgroup(self, p: tuple) -> bool:
+        # Scott, "A note on group membership tests for G1, G2 and GT on BLS
+        # pairing-friendly curves": P is in G1 iff phi(P) == -z^2 P, with the
+        # cube root BETA^2 that matches -z^2, two short multiplications in
+        # place of one by the 255-bit curve order
+        if p[2] == 0:
+            return True
+        X, Y, Z = p
+        z2p = _double_and_add(self, _double_and_add(self, p, Z_ABS), Z_ABS)
+        return self.eq((BETA * BETA * X % q, Y, Z), self.neg(z2p))
+
+    def eq(self, p1: tuple, p2: tuple) -> bool:
+        X1, Y1, Z1 = p1
+        X2, Y2, Z2 = p2
+        if Z1 == 0 or Z2 == 0:
+            return Z1 == Z2
+        Z1Z1 = Z1 * Z1 % q
+        Z2Z2 = Z2 * Z2 % q
+        return (X1 * Z2Z2 - X2 * Z1Z1) % q == 0 and (
+            Y1 * Z2Z2 * Z2 - Y2 * Z1Z1 * Z1
+        ) % q == 0
+
+    def is_inf(self, p: tuple) -> bool:
+        return p[2] == 0
+
+    def _encode_affine(self, x: int, y: int) -> bytes:
+        a_flag = (y * 2) // q
+        return (x + a_flag * POW_2_381 + POW_2_383).to_bytes(48, "big")
+
+    def encode(self, p: tuple) -> bytes:
+        return self.encode_many([p])[0]
+
+    def encode_many(self, points: list[tuple]) -> list[bytes]:
+        infinity = (POW_2_383 + POW_2_382).to_bytes(48, "big")
+        return [
+            infinity if p is None else self._encode_affine(*p[:2])
+            for p in self._normalize(points)
+        ]
+
+    def _normalize(self, points: list[tuple]) -> list[tuple | None]:
+        # affine (x, y, 1) for every finite point, None for infinity
+        inverses = iter(batch_inverse([p[2] for p in points if p[2] != 0]))
+        normalized = []
+        for X, Y, Z in points:
+            if Z == 0:
+                normalized.append(None)
+                continue
+            z_inverse = next(inverses)
+            z_inverse_2 = z_inverse * z_inverse % q
+            normalized.append((X * z_inverse_2 % q, Y * z_inverse_2 * z_inverse % q, 1))
+        return normalized
+
+    def normalize_many(self, points: list[tuple]) -> list[tuple]:
+        return [self.zero if p is None else p for p in self._normalize(points)]
+
+    def decode(self, data: bytes, validate: bool = True) -> tuple:
+        self.check_size(data)
+        # the same checks as py_ecc's decompress_G1
+        z = int.from_bytes(data, "big")
+        c_flag, b_flag, a_flag = _flags(z)
+        if validate and not c_flag:
+            raise ValueError("c_flag should be 1")
+        is_inf_pt = z % POW_2_381 == 0
+        if validate and b_flag != is_inf_pt:
+            raise ValueError(f"b_flag should be {int(is_inf_pt)}")
+        if is_inf_pt:
+            if validate and a_flag:
+                raise ValueError("a point at infinity should have a_flag == 0")
+            return self.zero
+        x = z % POW_2_381
+        if validate and x >= q:
+            raise ValueError(f"Point value should be less than field modulus. Got {x}")
+        rhs = (x * x * x + 4) % q
+        y = pow(rhs, (q + 1) // 4, q)
+        if validate and y * y % q != rhs:
+            raise ValueError("The given point is not on G1: y**2 = x**3 + b")
+        if (y * 2) // q != int(a_flag):
+            y = q - y
+        return x, y, 1
+
+    def affine(self, p: tuple) -> tuple | None:
+        normalized = self._normalize([p])[0]
+        return None if normalized is None else normalized[:2]
+
+    def to_reference(self, p: tuple) -> tuple:
+        # jacobian (X, Y, Z) is homogeneous (X Z, Y, Z^3)
+        X, Y, Z = p
+        return FQ(X * Z % q), FQ(Y), FQ(Z * Z * Z % q)
+
+    def from_reference(self, p: tuple) -> tuple:
+        # homogeneous (X, Y, Z) is jacobian (X Z, Y Z^2, Z)
+        X, Y, Z = p[0].n, p[1].n, p[2].n
+        if Z == 0:
+            return self.zero
+        return X * Z % q, Y * Z * Z % q, Z
+
+
+class IntG2(GroupOps):
+    """
+    G2 in Jacobian coordinates over FQ2 (int pairs), with the same a = 0
+    formulas as G1.
+    """
+
+    zero = (F2_ONE, F2_ONE, F2_ZERO)
+    generator = (tuple(G2[0].coeffs), tuple(G2[1].coeffs), F2_ONE)
+    size = 96
+
+    def add(self, p1: tuple, p2: tuple) -> tuple:
+        X1, Y1, Z1 = p1
+        X2, Y2, Z2 = p2
+        if Z1 == F2_ZERO:
+            return p2
+        if Z2 == F2_ZERO:
+            return p1
+        Z1Z1 = f2_sqr(Z1)
+        U2 = f2_mul(X2, Z1Z1)
+        S2 = f2_mul(Y2, f2_mul(Z1, Z1Z1))
+        if Z2 == F2_ONE:
+            U1 = X1
+            S1 = Y1
+        else:
+            Z2Z2 = f2_sqr(Z2)
+            U1 = f2_mul(X1, Z2Z2)
+            S1 = f2_mul(Y1, f2_mul(Z2, Z2Z2))
+        H = f2_sub(U2, U1)
+        r = f2_scale(f2_sub(S2, S1), 2)
+        if H == F2_ZERO:
+            if r == F2_ZERO:
+                return self.double(p1)
+            return self.zero
+        I = f2_scale(f2_sqr(H), 4)  # noqa: E741
+        J = f2_mul(H, I)
+        V = f2_mul(U1, I)
+        X3 = f2_sub(f2_sub(f2_sqr(r), J), f2_scale(V, 2))
+        Y3 = f2_sub(f2_mul(r, f2_sub(V, X3)), f2_scale(f2_mul(S1, J), 2))
+        Z3 = f2_scale(f2_mul(Z1, H), 2)
+        if Z2 != F2_ONE:
+            Z3 = f2_mul(Z3, Z2)
+        return X3, Y3, Z3
+
+    def double(self, p: tuple) -> tuple:
+        X, Y, Z = p
+        if Z == F2_ZERO:
+            return p
+        A = f2_sqr(X)
+        B = f2_sqr(Y)
+        C = f2_sqr(B)
+        D = f2_scale(f2_sub(f2_sub(f2_sqr(f2_add(X, B)), A), C), 2)
+        E = f2_scale(A, 3)
+        X3 = f2_sub(f2_sqr(E), f2_scale(D, 2))
+        Y3 = f2_sub(f2_mul(E, f2_sub(D, X3)), f2_scale(C, 8))
+        Z3 = f2_scale(f2_mul(Y, Z), 2)
+        return X3, Y3, Z3
+
+    def neg(self, p: tuple) -> tuple:
+        X, (y0, y1), Z = p
+        return X, (-y0 % q, -y1 % q), Z
+
+    def psi(self, p: tuple) -> tuple:
+        # untwist, Frobenius, twist, on jacobian coordinates
+        X, Y, Z = p
+        return (
+            f2_mul(PSI_X, (X[0], -X[1] % q)),
+            f2_mul(PSI_Y, (Y[0], -Y[1] % q)),
+            (Z[0], -Z[1] % q),
+        )
+
+    def in_subgroup(self, p: tuple) -> bool:
+        # Scott: P is in G2 iff psi(P) == z P, one 64-bit multiplication in
+        # place of one by the 255-bit curve order
+        if p[2] == F2_ZERO:
+            return True
+        return self.eq(self.psi(p), self.neg(_double_and_add(self, p, Z_ABS)))
+
+    def multiply(self, p: tuple, scalar: int) -> tuple:
+        return _window_multiply(self, p, scalar)
+
+    def eq(self, p1: tuple, p2: tuple) -> bool:
+        X1, Y1, Z1 = p1
+        X2, Y2, Z2 = p2
+        if Z1 == F2_ZERO or Z2 == F2_ZERO:
+            return Z1 == Z2
+        Z1Z1 = f2_sqr(Z1)
+        Z2Z2 = f2_sqr(Z2)
+        return f2_mul(X1, Z2Z2) == f2_mul(X2, Z1Z1) and f2_mul(
+            Y1, f2_mul(Z2Z2, Z2)
+        ) == f2_mul(Y2, f2_mul(Z1Z1, Z1))
+
+    def is_inf(self, p: tuple) -> bool:
+        return p[2] == F2_ZERO
+
+    def _normalize(self, points: list[tuple]) -> list[tuple | None]:
+        # 1 / (z0 + z1 i) = (z0 - z1 i) / (z0^2 + z1^2), the norms share one
+        # inversion
+        finite = [p[2] for p in points if p[2] != F2_ZERO]
+        norms = [(z0 * z0 + z1 * z1) % q for z0, z1 in finite]
+        inverses = iter(batch_inverse(norms))
+        normalized = []
+        for X, Y, Z in points:
+            if Z == F2_ZERO:
+                normalized.append(None)
+                continue
+            norm_inverse = next(inverses)
+            z_inverse = (Z[0] * norm_inverse % q, -Z[1] * norm_inverse % q)
+            z_inverse_2 = f2_sqr(z_inverse)
+            normalized.append(
+                (
+                    f2_mul(X, z_inverse_2),
+                    f2_mul(Y, f2_mul(z_inverse_2, z_inverse)),
+                    F2_ONE,
+                )
+            )
+        return normalized
+
+    def normalize_many(self, points: list[tuple]) -> list[tuple]:
+        return [self.zero if p is None else p for p in self._normalize(points)]
+
+    def encode(self, p: tuple) -> bytes:
+        return self.encode_many([p])[0]
+
+    def encode_many(self, points: list[tuple]) -> list[bytes]:
+        infinity = (POW_2_383 + POW_2_382).to_bytes(48, "big") + bytes(48)
+        encoded = []
+        for p in self._normalize(points):
+            if p is None:
+                encoded.append(infinity)
+                continue
+            (x_re, x_im), (y_re, y_im), _ = p
+            a_flag = (y_im * 2) // q if y_im > 0 else (y_re * 2) // q
+            encoded.append(
+                (x_im + a_flag * POW_2_381 + POW_2_383).to_bytes(48, "big")
+                + x_re.to_bytes(48, "big")
+            )
+        return encoded
+
+    def decode(self, data: bytes, validate: bool = True) -> tuple:
+        self.check_size(data)
+        # the same checks as py_ecc's decompress_G2, the square root itself
+        # cannot be skipped
+        z1 = int.from_bytes(data[:48], "big")
+        z2 = int.from_bytes(data[48:], "big")
+        c_flag1, b_flag1, a_flag1 = _flags(z1)
+        if validate and not c_flag1:
+            raise ValueError("c_flag should be 1")
+        is_inf_pt = z1 % POW_2_381 == 0 and z2 == 0
+        if validate and b_flag1 != is_inf_pt:
+            raise ValueError(f"b_flag should be {int(is_inf_pt)}")
+        if is_inf_pt:
+            if validate and a_flag1:
+                raise ValueError("a point at infinity should have a_flag == 0")
+            return self.zero
+        x1 = z1 % POW_2_381
+        if validate and x1 >= q:
+            raise ValueError(f"x1 value should be less than field modulus. Got {x1}")
+        if validate and z2 >= q:
+            raise ValueError(
+                f"z2 point value should be less than field modulus. Got {z2}"
+            )
+        x = (z2, x1)
+        y = f2_sqrt(f2_add(f2_mul(f2_sqr(x), x), B2))
+        if y is None:
+            raise ValueError("Failed to find a modular squareroot")
+        y_re, y_im = y
+        if (y_im > 0 and (y_im * 2) // q != int(a_flag1)) or (
+            y_im == 0 and (y_re * 2) // q != int(a_flag1)
+        ):
+            y = (-y_re % q, -y_im % q)
+        return x, y, F2_ONE
+
+    def affine(self, p: tuple) -> tuple | None:
+        normalized = self._normalize([p])[0]
+        return None if normalized is None else normalized[:2]
+
+    def to_reference(self, p: tuple) -> tuple:
+        X, Y, Z = p
+        return (
+            FQ2(f2_mul(X, Z)),
+            FQ2(Y),
+            FQ2(f2_mul(f2_sqr(Z), Z)),
+        )
+
+    def from_reference(self, p: tuple) -> tuple:
+        X, Y, Z = (tuple(c.coeffs) for c in p)
+        if Z == F2_ZERO:
+            return self.zero
+        return f2_mul(X, Z), f2_mul(Y, f2_sqr(Z)), Z
+
+
+backend = Backend("python", IntG1(), IntG2())
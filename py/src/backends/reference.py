@@ -0,0 +1,145 @@
+from py_ecc.bls.constants import POW_2_381, POW_2_383
+from py_ecc.bls.g2_primitives import (
+    G1_to_pubkey,
+    G2_to_signature,
+    pubkey_to_G1,
+    signature_to_G2,
+)
+from py_ecc.optimized_bls12_381 import (
+    G1,
+    G2,
+    Z1,
+    Z2,
+    add,
+    curve_order,
+    double,
+    eq,
+    field_modulus,
+    is_inf,
+    multiply,
+    neg,
+    normalize,
+)
+
+from src.backends import Backend, GroupOps
+from src.backends.common import batch_inverse
+
+
+class _PyEccGroup(GroupOps):
+    # py_ecc's optimized homogeneous projective arithmetic, shared by G1 and G2
+
+    def add(self, p: tuple, q: tuple) -> tuple:
+        return add(p, q)
+
+    def double(self, p: tuple) -> tuple:
+        return double(p)
+
+    def neg(self, p: tuple) -> tuple:
+        return neg(p)
+
+    def multiply(self, p: tuple, scalar: int) -> tuple:
+        return multiply(p, scalar)
+
+    def eq(self, p: tuple, q: tuple) -> bool:
+        return eq(p, q)
+
+    def is_inf(self, p: tuple) -> bool:
+        return is_inf(p)
+
+    def in_subgroup(self, p: tuple) -> bool:
+        # the textbook check, r P is the identity
+        return is_inf(multiply(p, curve_order))
+
+    def to_reference(self, p: tuple) -> tuple:
+        return p
+
+    def from_reference(self, p: tuple) -> tuple:
+        return p
+
+
+class PyEccG1(_PyEccGroup):
+    zero = Z1
+    generator = G1
+    size = 48
+
+    def encode(self, p: tuple) -> bytes:
+        return G1_to_pubkey(p)
+
+    def encode_many(self, points: list[tuple]) -> list[bytes]:
+        # one shared inversion normalizes every z coordinate
+        q = field_modulus
+        finite = [p for p in points if not is_inf(p)]
+        inverses = iter(batch_inverse([p[2].n for p in finite]))
+        encoded = []
+        for p in points:
+            if is_inf(p):
+                encoded.append(G1_to_pubkey(p))
+                continue
+            z_inverse = next(inverses)
+            x = p[0].n * z_inverse % q
+            y = p[1].n * z_inverse % q
+            a_flag = (y * 2) // q
+            encoded.append((x + a_flag * POW_2_381 + POW_2_383).to_bytes(48, "big"))
+        return encoded
+
+    def decode(self, data: bytes, validate: bool = True) -> tuple:
+        self.check_size(data)
+        return pubkey_to_G1(data)
+
+    def affine(self, p: tuple) -> tuple | None:
+        if is_inf(p):
+            return None
+        x, y = normalize(p)
+        return x.n, y.n
+
+
+class PyEccG2(_PyEccGroup):
+    zero = Z2
+    generator = G2
+    size = 96
+
+    def encode(self, p: tuple) -> bytes:
+        return G2_to_signature(p)
+
+    def encode_many(self, points: list[tuple]) -> list[bytes]:
+        # 1 / (z0 + z1 i) = (z0 - z1 i) / (z0^2 + z1^2), so the norms share one
+        # inversion
+        q = field_modulus
+        finite = [p for p in points if not is_inf(p)]
+        norms = []
+        for p in finite:
+            z0, z1 = p[2].coeffs
+            norms.append((z0 * z0 + z1 * z1) % q)
+        inverses = iter(batch_inverse(norms))
+        encoded = []
+        for p in points:
+            if is_inf(p):
+                encoded.append(G2_to_signature(p))
+                continue
+            norm_inverse = next(inverses)
+            x, y, z = p
+            z0, z1 = z.coeffs
+            i0, i1 = z0 * norm_inverse % q, -z1 * norm_inverse % q
+            x0, x1 = x.coeffs
+            y0, y1 = y.coeffs
+            x_re, x_im = (x0 * i0 - x1 * i1) % q, (x0 * i1 + x1 * i0) % q
+            y_re, y_im = (y0 * i0 - y1 * i1) % q, (y0 * i1 + y1 * i0) % q
+            a_flag = (y_im * 2) // q if y_im > 0 else (y_re * 2) // q
+            encoded.append(
+                (x_im + a_flag * POW_2_381 + POW_2_383).to_bytes(48, "big")
+                + x_re.to_bytes(48, "big")
+            )
+        return encoded
+
+    def decode(self, data: bytes, validate: bool = True) -> tuple:
+        self.check_size(data)
+        return signature_to_G2(data)
+
+    def affine(self, p: tuple) -> tuple | None:
+        if is_inf(p):
+            return None
+        x, y = normalize(p)
+        return tuple(x.coeffs), tuple(y.coeffs)
+
+
+backend = Backend("py_ecc", PyEccG1(), PyEccG2())
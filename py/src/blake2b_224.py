@@ -31,6 +31,21 @@ def generate(input_string: str) -> str:
     return hash_digest
 
 
+def fiat_shamir_digest(gb: bytes, grb: bytes, ub: bytes) -> bytes:
+    """
+    Applies the Fiat-Shamir heuristic to the raw transcript bytes.
+
+    Parameters:
+    gb (bytes): The first input, typically a compressed point.
+    grb (bytes): The second input, typically a compressed point.
+    ub (bytes): The third input, typically a compressed point.
+
+    Returns:
+    bytes: The 28 byte blake2b_224 digest of the concatenated inputs.
+    """
+    return blake2b(b"".join([gb, grb, ub]), digest_size=28).digest()
+
+
 def fiat_shamir_heuristic(gb: str, grb: str, ub: str) -> str:
     """
     Applies the Fiat-Shamir heuristic to generate a hash.
@@ -43,13 +58,4 @@ def fiat_shamir_heuristic(gb: str, grb: str, ub: str) -> str:
     Returns:
     str: The resulting hash as a hexadecimal string.
     """
-    # Concatenate the input strings
-    concatenated_bytes = gb + grb + ub
-
-    # Convert the concatenated hex string to bytes
-    unhexed_bytes = unhexlify(concatenated_bytes)
-
-    # Compute the blake2b_224 hash of the bytes and convert to a hex string
-    hash_result = blake2b(unhexed_bytes, digest_size=28).digest().hex()
-
-    return hash_result
+    return fiat_shamir_digest(unhexlify(gb), unhexlify(grb), unhexlify(ub)).hex()
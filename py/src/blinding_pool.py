@@ -0,0 +1,110 @@
+import threading
+from collections import deque
+
+from src.bls12_381 import G1Point
+from src.commitment import blinding_pair, blinding_pairs
+
+
+class BlindingPool:
+    """
+    A bounded pool of precomputed blinding pairs (r, r * g).
+
+    The r * g half of a commitment does not depend on the committed value, so
+    it can be computed ahead of time, offline, and the online phase is left
+    with v * h and a few additions. A background thread keeps the pool topped
+    up: once it holds no more than refill_at pairs it is refilled to size, in
+    batches that share one normalization so later additions take the mixed
+    path. Every pair is handed out exactly once. An empty pool never blocks,
+    take computes a fresh pair instead and counts a miss.
+
+    Attributes:
+        size (int): The most pairs the pool holds.
+        refill_at (int): The level at or below which refilling starts.
+        batch (int): The pairs computed per refill step.
+        misses (int): How often take found the pool empty.
+    """
+
+    def __init__(
+        self,
+        size: int = 1024,
+        refill_at: int | None = None,
+        batch: int = 64,
+        background: bool = True,
+    ) -> None:
+        if size < 1:
+            raise ValueError("BlindingPool size must be at least one")
+        self.size = size
+        self.refill_at = size // 2 if refill_at is None else refill_at
+        self.batch = batch
+        self.misses = 0
+        self._pairs: deque[tuple[int, G1Point]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name="blinding-pool", daemon=True
+            )
+            self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def take(self) -> tuple[int, G1Point]:
+        """
+        Removes one pair from the pool.
+
+        Returns:
+            tuple[int, G1Point]: A pair (r, r * g) that is never handed out again.
+        """
+        with self._cond:
+            pair = self._pairs.popleft() if self._pairs else None
+            if pair is None:
+                self.misses += 1
+            if len(self._pairs) <= self.refill_at:
+                self._cond.notify()
+        if pair is None:
+            return blinding_pair()
+        return pair
+
+    def fill(self) -> None:
+        """
+        Tops the pool up to its size in the calling thread.
+        """
+        while True:
+            with self._cond:
+                missing = self.size - len(self._pairs)
+                if missing <= 0 or self._closed:
+                    return
+            pairs = blinding_pairs(min(self.batch, missing))
+            with self._cond:
+                # a concurrent fill may have won the race for the space
+                self._pairs.extend(pairs[: self.size - len(self._pairs)])
+
+    def close(self) -> None:
+        """
+        Stops the background thread, pairs already in the pool stay usable.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "BlindingPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                # a full pool waits as well, refill_at may be as high as size
+                while not self._closed and (
+                    len(self._pairs) >= self.size or len(self._pairs) > self.refill_at
+                ):
+                    self._cond.wait()
+                if self._closed:
+                    return
+            self.fill()
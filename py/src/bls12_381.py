@@ -1,26 +1,30 @@
 import secrets
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Self
 
-from py_ecc.bls.g2_primitives import (
-    G1_to_pubkey,
-    G2_to_signature,
-    pubkey_to_G1,
-    signature_to_G2,
-)
 from py_ecc.fields import optimized_bls12_381_FQ as FQ
 from py_ecc.fields import optimized_bls12_381_FQ2 as FQ2
 from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
 from py_ecc.optimized_bls12_381 import (
-    G1,
-    G2,
     Z1,
     Z2,
     add,
     curve_order,
-    multiply,
-    neg,
+    double,
+    field_modulus,
+    final_exponentiate,
     pairing,
+    twist,
+)
+from py_ecc.optimized_bls12_381.optimized_pairing import (
+    miller_loop,
+    pseudo_binary_encoding,
 )
 
+from src.backends import GroupOps, get_backend
+from src.backends.common import wnaf
+
 
 def rng() -> int:
     """
@@ -34,6 +38,568 @@ def rng() -> int:
     return random_bits
 
 
+def random_weight() -> int:
+    """
+    Generates a random nonzero 128-bit weight for random linear combinations.
+
+    Returns:
+        int: A random number in [1, 2^128).
+    """
+    return secrets.randbits(128) or 1
+
+
+# point validation levels, from the most to the least thorough
+FULL = "full"
+ON_CURVE_ONLY = "on-curve-only"
+TRUSTED = "trusted"
+validation_levels = (FULL, ON_CURVE_ONLY, TRUSTED)
+
+
+def _check_validation(validation: str) -> None:
+    if validation not in validation_levels:
+        raise ValueError(f"Unknown validation level: {validation}")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the decompression cache.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to decompress.
+        maxsize (int): The maximum number of entries, zero when disabled.
+        currsize (int): The current number of entries.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DecompressionCache:
+    """
+    A bounded, thread-safe LRU cache from compressed bytes to decoded points.
+
+    Decompression needs a modular square root, and the same compressed points
+    (the generators, bound commitments, proof points that are checked more than
+    once) come through again and again. Entries are shared by G1 and G2 and
+    keyed by the backend group arithmetic and the compressed bytes. Every entry
+    remembers whether it passed the subgroup check, so a point is checked at
+    most once however often it is decoded. A maxsize of zero turns the cache
+    off.
+
+    Attributes:
+        maxsize (int): The maximum number of cached points.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[GroupOps, bytes], tuple[tuple, str]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, group: type, data: bytes, validation: str = FULL) -> tuple:
+        """
+        Returns the decoded point for the compressed bytes, decoding on a miss.
+
+        Args:
+            group (type): The point class, G1Point or G2Point.
+            data (bytes): The compressed point.
+            validation (str, optional): The validation level. Defaults to "full".
+
+        Returns:
+            tuple: The projective coordinates of the point in the active backend.
+        """
+        _check_validation(validation)
+        ops = group._ops()
+        key = (ops, data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        # decode and check outside of the lock, a racing thread at worst
+        # repeats the work
+        if entry is None:
+            pt = ops.decode(data, validate=validation != TRUSTED)
+            level = TRUSTED if validation == TRUSTED else ON_CURVE_ONLY
+        else:
+            pt, level = entry
+            if level == TRUSTED and validation != TRUSTED:
+                # trusted entries skipped the decoding checks
+                pt = ops.decode(data)
+                level = ON_CURVE_ONLY
+        if validation == FULL and level != FULL:
+            if not ops.in_subgroup(pt):
+                raise ValueError(
+                    f"The given point is not in the {group._group.upper()} subgroup"
+                )
+            level = FULL
+        if entry is None or entry[1] != level:
+            with self._lock:
+                if self.maxsize > 0:
+                    self._entries[key] = (pt, level)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+        return pt
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the maximum number of entries, zero disables the cache.
+
+        Args:
+            maxsize (int): The new maximum number of cached points.
+        """
+        with self._lock:
+            self.maxsize = max(0, maxsize)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Reports the cache statistics.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+
+# shared by every decode in the process
+decompression_cache = DecompressionCache()
+
+
+class Point:
+    """
+    A BLS12-381 group element kept in projective form.
+
+    Group operations stay on the projective coordinates, so a chain of
+    additions and multiplications never leaves the curve. The coordinates
+    belong to the backend that created the point, and a point from another
+    backend is converted through the py_ecc representation when the two meet.
+    The compressed encoding is only computed when it is asked for and is then
+    remembered.
+
+    Attributes:
+        pt (tuple): The projective coordinates of the point.
+        ops (GroupOps): The backend arithmetic the coordinates belong to.
+    """
+
+    __slots__ = ("pt", "ops", "_compressed")
+
+    # set by the concrete groups, the Backend attribute holding their GroupOps
+    _group: str
+
+    def __init__(self, pt: tuple, ops: GroupOps | None = None) -> None:
+        self.pt = pt
+        self.ops = ops if ops is not None else self._ops()
+        self._compressed: bytes | None = None
+
+    @classmethod
+    def _ops(cls) -> GroupOps:
+        return getattr(get_backend(), cls._group)
+
+    @classmethod
+    def generator(cls) -> Self:
+        ops = cls._ops()
+        return cls(ops.generator, ops)
+
+    @classmethod
+    def identity(cls) -> Self:
+        ops = cls._ops()
+        return cls(ops.zero, ops)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, validation: str = FULL) -> Self:
+        """
+        Decodes a compressed point.
+
+        Args:
+            data (bytes): The compressed point.
+            validation (str, optional): "full" checks the encoding, the curve
+                equation and subgroup membership, "on-curve-only" skips the
+                subgroup check for points we produced ourselves, and "trusted"
+                skips every check that decompression does not need. Defaults
+                to "full".
+
+        Returns:
+            G1Point | G2Point: The point.
+        """
+        data = bytes(data)
+        point = cls(decompression_cache.lookup(cls, data, validation))
+        point._compressed = data
+        return point
+
+    @classmethod
+    def from_hex(cls, element: str, validation: str = FULL) -> Self:
+        return cls.from_bytes(bytes.fromhex(element), validation)
+
+    def in_subgroup(self) -> bool:
+        return self.ops.in_subgroup(self.pt)
+
+    @classmethod
+    def from_reference(cls, pt: tuple) -> Self:
+        ops = cls._ops()
+        return cls(ops.from_reference(pt), ops)
+
+    def reference(self) -> tuple:
+        return self.ops.to_reference(self.pt)
+
+    def affine(self) -> tuple | None:
+        return self.ops.affine(self.pt)
+
+    def coordinates(self, ops: GroupOps) -> tuple:
+        """
+        Returns the coordinates of the point in the representation of a backend.
+
+        Args:
+            ops (GroupOps): The backend group arithmetic.
+
+        Returns:
+            tuple: The coordinates, converted through py_ecc when the backends differ.
+        """
+        if ops is self.ops:
+            return self.pt
+        return ops.from_reference(self.reference())
+
+    def _coordinates(self, other: Self) -> tuple:
+        # the other point's coordinates in this point's backend
+        return other.coordinates(self.ops)
+
+    def to_bytes(self) -> bytes:
+        if self._compressed is None:
+            self._compressed = self.ops.encode(self.pt)
+        return self._compressed
+
+    def hex(self) -> str:
+        return self.to_bytes().hex()
+
+    def is_identity(self) -> bool:
+        return self.ops.is_inf(self.pt)
+
+    def __str__(self) -> str:
+        return self.hex()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.hex()})"
+
+    def __add__(self, other) -> Self:
+        if type(other) is not type(self):
+            return NotImplemented
+        return type(self)(self.ops.add(self.pt, self._coordinates(other)), self.ops)
+
+    def __sub__(self, other) -> Self:
+        if type(other) is not type(self):
+            return NotImplemented
+        ops = self.ops
+        return type(self)(ops.add(self.pt, ops.neg(self._coordinates(other))), ops)
+
+    def __neg__(self) -> Self:
+        return type(self)(self.ops.neg(self.pt), self.ops)
+
+    def __mul__(self, other) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return type(self)(self.ops.multiply(self.pt, other % curve_order), self.ops)
+
+    def __rmul__(self, other) -> Self:
+        return self.__mul__(other)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.ops.eq(self.pt, self._coordinates(other))
+
+    def __hash__(self) -> int:
+        return hash(self.to_bytes())
+
+
+class G1Point(Point):
+    """
+    A point in the BLS12-381 G1 group, 48 bytes when compressed.
+    """
+
+    __slots__ = ()
+
+    _group = "g1"
+
+
+class G2Point(Point):
+    """
+    A point in the BLS12-381 G2 group, 96 bytes when compressed.
+    """
+
+    __slots__ = ()
+
+    _group = "g2"
+
+
+class FixedBase:
+    """
+    Fixed-base scalar multiplication with a precomputed window table.
+
+    The table holds every multiple j * 2^(w * i) * P for each w-bit window i,
+    so a multiplication is one table lookup and one addition per window and
+    needs no doublings at all. The table is built on first use, once per
+    backend, normalized so that additions from it take the cheaper mixed path,
+    and then shared by every caller in the process.
+
+    Attributes:
+        point (G1Point | G2Point): The fixed base point.
+        window (int): The window width in bits.
+    """
+
+    def __init__(self, point: Point, window: int = 8) -> None:
+        self.point = point
+        self.window = window
+        self._tables: dict[GroupOps, list[list[tuple]]] = {}
+        self._lock = threading.Lock()
+
+    def table(self, ops: GroupOps | None = None) -> list[list[tuple]]:
+        """
+        Returns the precomputed window table, building it on the first call.
+
+        Args:
+            ops (GroupOps, optional): The backend arithmetic. Defaults to the active backend.
+
+        Returns:
+            list[list[tuple]]: One row of 2^w projective multiples per window.
+        """
+        if ops is None:
+            ops = self.point._ops()
+        table = self._tables.get(ops)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(ops)
+                if table is None:
+                    table = self._tables[ops] = self._build(ops)
+        return table
+
+    def _build(self, ops: GroupOps) -> list[list[tuple]]:
+        size = 1 << self.window
+        windows = -(-curve_order.bit_length() // self.window)
+        rows = []
+        base = ops.from_reference(self.point.reference())
+        for _ in range(windows):
+            row = [ops.zero, base]
+            for _ in range(2, size):
+                row.append(ops.add(row[-1], base))
+            rows.append(ops.normalize_many(row))
+            # the next window starts at 2^w times this one
+            base = ops.add(row[-1], base)
+        return rows
+
+    def multiply(self, scalar: int) -> Point:
+        """
+        Multiplies the fixed base point by a scalar using the window table.
+
+        Args:
+            scalar (int): The scalar value for multiplication.
+
+        Returns:
+            G1Point | G2Point: The resulting point.
+        """
+        ops = self.point._ops()
+        return type(self.point)(self._accumulate(ops, ops.zero, scalar), ops)
+
+    def _accumulate(self, ops: GroupOps, acc: tuple, scalar: int) -> tuple:
+        # adds scalar * point onto a projective accumulator
+        table = self.table(ops)
+        add = ops.add
+        scalar %= curve_order
+        mask = (1 << self.window) - 1
+        i = 0
+        while scalar:
+            digit = scalar & mask
+            if digit:
+                acc = add(acc, table[i][digit])
+            scalar >>= self.window
+            i += 1
+        return acc
+
+
+def _straus(ops: GroupOps, pts: list[tuple], scalars: list[int], window: int) -> tuple:
+    # interleaved wNAF, every point shares the doublings and the additions come
+    # from normalized tables of odd multiples
+    add = ops.add
+    double = ops.double
+    size = 1 << (window - 2)
+    odd = []
+    for pt in pts:
+        twice = double(pt)
+        row = [pt]
+        for _ in range(size - 1):
+            row.append(add(row[-1], twice))
+        odd.extend(row)
+    odd = ops.normalize_many(odd)
+    tables = []
+    for i, scalar in enumerate(scalars):
+        row = odd[i * size : (i + 1) * size]
+        tables.append((wnaf(scalar, window), row, [ops.neg(pt) for pt in row]))
+    length = max((len(digits) for digits, _, _ in tables), default=0)
+    acc = ops.zero
+    for i in range(length - 1, -1, -1):
+        acc = double(acc)
+        for digits, positive, negative in tables:
+            if i < len(digits):
+                digit = digits[i]
+                if digit > 0:
+                    acc = add(acc, positive[digit >> 1])
+                elif digit < 0:
+                    acc = add(acc, negative[-digit >> 1])
+    return acc
+
+
+def _pippenger(
+    ops: GroupOps, pts: list[tuple], scalars: list[int], window: int
+) -> tuple:
+    # bucket method, each window sorts the points into buckets by digit
+    add = ops.add
+    double = ops.double
+    mask = (1 << window) - 1
+    bits = max((scalar.bit_length() for scalar in scalars), default=0)
+    result = None
+    for shift in range(-(-bits // window) * window - window, -1, -window):
+        if result is not None:
+            for _ in range(window):
+                result = double(result)
+        buckets: list[tuple | None] = [None] * mask
+        for pt, scalar in zip(pts, scalars):
+            digit = (scalar >> shift) & mask
+            if digit:
+                bucket = buckets[digit - 1]
+                buckets[digit - 1] = pt if bucket is None else add(bucket, pt)
+        # running sums weight bucket d by d without any multiplications
+        running = None
+        total = None
+        for bucket in reversed(buckets):
+            if bucket is not None:
+                running = bucket if running is None else add(running, bucket)
+            if running is not None:
+                total = running if total is None else add(total, running)
+        if total is not None:
+            result = total if result is None else add(result, total)
+    return ops.zero if result is None else result
+
+
+# below this many variable points Straus beats the bucket method
+msm_crossover = 64
+
+
+def msm(points: list[Point | FixedBase], scalars: list[int]) -> Point:
+    """
+    Computes the multi-scalar multiplication sum(s_i * P_i).
+
+    Small inputs use Straus interleaving and larger ones use the Pippenger
+    bucket method, switching at msm_crossover points. A FixedBase in the input
+    is evaluated from its precomputed table and added to the result. The sum
+    is computed in the backend of the first point, or the active backend when
+    every base is fixed.
+
+    Args:
+        points (list[Point | FixedBase]): The points or fixed bases, all in one group.
+        scalars (list[int]): One scalar per point.
+
+    Returns:
+        G1Point | G2Point: The resulting point.
+    """
+    if len(points) != len(scalars):
+        raise ValueError("msm needs exactly one scalar per point")
+    if not points:
+        raise ValueError("msm needs at least one point")
+    variable = [point for point in points if not isinstance(point, FixedBase)]
+    if variable:
+        anchor = variable[0]
+    else:
+        anchor = points[0].point.identity()
+    group = type(anchor)
+    ops = anchor.ops
+    pts = []
+    reduced = []
+    fixed = []
+    for point, scalar in zip(points, scalars):
+        if isinstance(point, FixedBase):
+            fixed.append((point, scalar))
+        elif scalar % curve_order:
+            pts.append(anchor._coordinates(point))
+            reduced.append(scalar % curve_order)
+    if ops.native_msm:
+        acc = ops.msm(pts, reduced) if pts else ops.zero
+    else:
+        # an endomorphism trades every scalar for two of half the length
+        pts, reduced = ops.split_scalars(pts, reduced)
+        if len(pts) < msm_crossover:
+            acc = _straus(ops, pts, reduced, window=5)
+        else:
+            window = min(16, max(4, len(pts).bit_length() - 4))
+            acc = _pippenger(ops, pts, reduced, window)
+    for base, scalar in fixed:
+        acc = base._accumulate(ops, acc, scalar)
+    return group(acc, ops)
+
+
+def double_scalar_mul(
+    a: int, p: Point | FixedBase, b: int, q: Point | FixedBase
+) -> Point:
+    """
+    Computes a * p + b * q in one pass using Straus-Shamir interleaving.
+
+    Both scalars are walked window by window on a single doubling chain, so the
+    pair costs about as many doublings as one scalar multiplication. A base
+    given as a FixedBase is taken from its precomputed table instead and needs
+    no doublings at all.
+
+    Args:
+        a (int): The scalar for the first point.
+        p (Point | FixedBase): The first point or fixed base.
+        b (int): The scalar for the second point.
+        q (Point | FixedBase): The second point or fixed base.
+
+    Returns:
+        G1Point | G2Point: The resulting point.
+    """
+    return msm([p, q], [a, b])
+
+
+def decode(element: str, validation: str = FULL) -> G1Point | G2Point:
+    """
+    Decodes a compressed hexadecimal string into a G1 or G2 point object.
+
+    Args:
+        element (str): The compressed point as a hexadecimal string.
+        validation (str, optional): One of validation_levels. Defaults to "full".
+
+    Returns:
+        G1Point | G2Point: The point, G1 for 48 bytes and G2 otherwise.
+    """
+    if len(element) == 96:
+        return G1Point.from_hex(element, validation)
+    else:
+        return G2Point.from_hex(element, validation)
+
+
 def g2_point(scalar: int) -> str:
     """
     Generates a BLS12-381 point from the G2 generator using scalar multiplication
@@ -45,7 +611,7 @@ def g2_point(scalar: int) -> str:
     Returns:
         bytes: The resulting BLS12-381 G2 point in compressed format.
     """
-    return G2_to_signature(multiply(G2, scalar)).hex()
+    return (G2Point.generator() * scalar).hex()
 
 
 def g1_point(scalar: int) -> str:
@@ -59,7 +625,7 @@ def g1_point(scalar: int) -> str:
     Returns:
         bytes: The resulting BLS12-381 G1 point in compressed format.
     """
-    return G1_to_pubkey(multiply(G1, scalar)).hex()
+    return (G1Point.generator() * scalar).hex()
 
 
 def uncompress(element: str) -> tuple:
@@ -72,10 +638,7 @@ def uncompress(element: str) -> tuple:
     Returns:
         tuple: The uncompressed point.
     """
-    if len(element) == 96:
-        return pubkey_to_G1(bytes.fromhex(element))
-    else:
-        return signature_to_G2(bytes.fromhex(element))
+    return decode(element).reference()
 
 
 def compress(element: tuple) -> str:
@@ -89,9 +652,59 @@ def compress(element: tuple) -> str:
         str: The compressed point as a hexadecimal string.
     """
     if isinstance(element[2], FQ):
-        return G1_to_pubkey(element).hex()
+        return G1Point.from_reference(element).hex()
     if isinstance(element[2], FQ2):
-        return G2_to_signature(element).hex()
+        return G2Point.from_reference(element).hex()
+
+
+def compress_many(points: list[Point]) -> list[bytes]:
+    """
+    Compresses many BLS12-381 points, sharing one field inversion between them.
+
+    Normalizing a projective point to affine coordinates needs the inverse of
+    its z coordinate. Montgomery's trick inverts the product of every z at once
+    and recovers the individual inverses with multiplications only. G2 points
+    invert the FQ norm of their FQ2 z coordinate the same way. The encoding is
+    identical to compress and is remembered by each point.
+
+    Args:
+        points (list[Point]): The G1 and G2 points to compress.
+
+    Returns:
+        list[bytes]: The compressed points, in input order.
+    """
+    pending: dict[GroupOps, list[Point]] = {}
+    for point in points:
+        if point._compressed is None:
+            pending.setdefault(point.ops, []).append(point)
+    for ops, group in pending.items():
+        encoded = ops.encode_many([point.pt for point in group])
+        for point, data in zip(group, encoded):
+            point._compressed = data
+    return [point.to_bytes() for point in points]
+
+
+def uncompress_many(
+    blobs: list[bytes], validation: str = FULL
+) -> list[G1Point | G2Point]:
+    """
+    Decompresses many compressed points, G1 for 48 bytes and G2 otherwise.
+
+    Every square root is independent, so there is no inversion to share here.
+    The blobs go through the decompression cache in one pass and each point
+    remembers its encoding, so compressing it again is free.
+
+    Args:
+        blobs (list[bytes]): The compressed points.
+        validation (str, optional): One of validation_levels. Defaults to "full".
+
+    Returns:
+        list[G1Point | G2Point]: The decoded points, in input order.
+    """
+    return [
+        (G1Point if len(blob) == 48 else G2Point).from_bytes(blob, validation)
+        for blob in blobs
+    ]
 
 
 def scale(element: str, scalar: int) -> str:
@@ -105,7 +718,7 @@ def scale(element: str, scalar: int) -> str:
     Returns:
         str: The resulting scaled point.
     """
-    return compress(multiply(uncompress(element), scalar))
+    return (decode(element) * scalar).hex()
 
 
 def combine(left_element: str, right_element: str) -> str:
@@ -119,7 +732,7 @@ def combine(left_element: str, right_element: str) -> str:
     Returns:
         str: The resulting combined point.
     """
-    return compress(add(uncompress(left_element), uncompress(right_element)))
+    return (decode(left_element) + decode(right_element)).hex()
 
 
 def invert(element: str) -> str:
@@ -132,22 +745,181 @@ def invert(element: str) -> str:
     Returns:
         str: The resulting combined point.
     """
-    return compress(neg(uncompress(element)))
+    return (-decode(element)).hex()
 
 
-def pair(g2_element: str, g1_element: str, final_exponentiate: bool = True) -> FQ12:
+def pair(
+    g2_element: str | G2Point,
+    g1_element: str | G1Point,
+    final_exponentiate: bool = True,
+) -> FQ12:
     """
-    Compute the pairing operation on elliptic curve points represented as strings.
+    Compute the pairing operation on elliptic curve points represented as strings
+    or point objects.
 
     Args:
-        g2_element (str): A string representation of a point on G2 elliptic curve.
-        g1_element (str): A string representation of a point on G1 elliptic curve.
+        g2_element (str | G2Point): A point on the G2 elliptic curve.
+        g1_element (str | G1Point): A point on the G1 elliptic curve.
         final_exponentiate (bool, optional): Whether to perform final exponentiation in the pairing computation. Defaults to True.
 
     Returns:
         FQ12: Result of the pairing operation as an element of the FQ12 field.
     """
-    return pairing(uncompress(g2_element), uncompress(g1_element), final_exponentiate)
+    if isinstance(g2_element, str):
+        g2_element = G2Point.from_hex(g2_element)
+    if isinstance(g1_element, str):
+        g1_element = G1Point.from_hex(g1_element)
+    return pairing(g2_element.reference(), g1_element.reference(), final_exponentiate)
+
+
+def _line(p1: tuple, p2: tuple) -> tuple:
+    # the line through two twisted points as coefficients (a, b, c, d) so that
+    # at T = (xt, yt, zt) its value is (a * xt + b * yt + c * zt) / (d * zt)
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    m_numerator = y2 * z1 - y1 * z2
+    m_denominator = x2 * z1 - x1 * z2
+    if m_denominator == FQ12.zero():
+        if m_numerator != FQ12.zero():
+            # vertical line
+            return z1, FQ12.zero(), -x1, z1
+        # tangent line
+        m_numerator = 3 * x1 * x1
+        m_denominator = 2 * y1 * z1
+    return (
+        m_numerator * z1,
+        -(m_denominator * z1),
+        m_denominator * y1 - m_numerator * x1,
+        m_denominator * z1,
+    )
+
+
+class PreparedG2:
+    """
+    A fixed G2 point with its Miller loop line functions precomputed.
+
+    The walk of R through the multiples of Q and every line function along the
+    way depend only on Q, so they are computed once and stored as coefficients.
+    A Miller loop against a prepared point only evaluates those lines at the G1
+    argument. The line denominators also depend only on Q, so their product is
+    inverted once here as well.
+
+    Attributes:
+        point (G2Point): The prepared G2 point.
+    """
+
+    def __init__(self, point: G2Point) -> None:
+        self.point = point
+        self._lines: list[tuple] | None = None
+        self._denominator: FQ12 | None = None
+        self._lock = threading.Lock()
+
+    def lines(self) -> list[tuple]:
+        """
+        Returns the line coefficients, computing them on the first call.
+
+        Returns:
+            list[tuple]: One (doubling, a, b, c) entry per Miller loop step.
+        """
+        if self._lines is None:
+            with self._lock:
+                if self._lines is None:
+                    self._prepare()
+        return self._lines
+
+    def _prepare(self) -> None:
+        Q = self.point.reference()
+        twist_Q = twist(Q)
+        R = Q
+        lines = []
+        denominator = FQ12.one()
+        for v in pseudo_binary_encoding[62::-1]:
+            twist_R = twist(R)
+            a, b, c, d = _line(twist_R, twist_R)
+            lines.append((True, a.coeffs, b.coeffs, c.coeffs))
+            denominator = denominator * denominator * d
+            R = double(R)
+            if v == 1:
+                a, b, c, d = _line(twist(R), twist_Q)
+                lines.append((False, a.coeffs, b.coeffs, c.coeffs))
+                denominator = denominator * d
+                R = add(R, Q)
+        self._denominator = FQ12.one() / denominator
+        self._lines = lines
+
+
+def _prepared_miller_loop(pairs: list[tuple[PreparedG2, G1Point]]) -> FQ12:
+    # one shared squaring chain for every pair, lines are only evaluated at P
+    if not pairs:
+        return FQ12.one()
+    q = field_modulus
+    points = []
+    f = FQ12.one()
+    for prepared, g1_element in pairs:
+        x, y = g1_element.affine()
+        points.append((prepared.lines(), x, y))
+        f = f * prepared._denominator
+    evaluations = FQ12.one()
+    for step, (doubling, *_) in enumerate(points[0][0]):
+        if doubling:
+            evaluations = evaluations * evaluations
+        for lines, x, y in points:
+            _, a, b, c = lines[step]
+            evaluations = evaluations * FQ12(
+                [(ai * x + bi * y + ci) % q for ai, bi, ci in zip(a, b, c)]
+            )
+    return evaluations * f
+
+
+def pairing_product_is_one(
+    pairs: list[tuple[str | G2Point | PreparedG2, str | G1Point]],
+) -> bool:
+    """
+    Checks that a product of pairings is the identity in GT.
+
+    The Miller loop outputs are multiplied together and a single final
+    exponentiation is applied to the product, so checking e(Q, X) == e(Q, Y)
+    as e(Q, X) * e(-Q, Y) == 1 costs one final exponentiation instead of two.
+    Pairs whose G2 side is a PreparedG2 share one Miller loop that only
+    evaluates the cached line functions. A backend with a native pairing gets
+    every pair in its own representation instead.
+
+    Args:
+        pairs (list[tuple[str | G2Point | PreparedG2, str | G1Point]]): The (G2, G1) pairs to multiply.
+
+    Returns:
+        bool: True if the product of all the pairings is one.
+    """
+    backend = get_backend()
+    native = []
+    f = FQ12.one()
+    prepared = []
+    for g2_element, g1_element in pairs:
+        if isinstance(g2_element, str):
+            g2_element = G2Point.from_hex(g2_element)
+        if isinstance(g1_element, str):
+            g1_element = G1Point.from_hex(g1_element)
+        if isinstance(g2_element, PreparedG2):
+            q_point = g2_element.point
+        else:
+            q_point = g2_element
+        # a pairing with the identity contributes nothing
+        if q_point.is_identity() or g1_element.is_identity():
+            continue
+        if backend.native_pairing:
+            native.append(
+                (q_point.coordinates(backend.g2), g1_element.coordinates(backend.g1))
+            )
+        elif isinstance(g2_element, PreparedG2):
+            prepared.append((g2_element, g1_element))
+        else:
+            f = f * miller_loop(
+                g2_element.reference(), g1_element.reference(), final_exponentiate=False
+            )
+    if backend.native_pairing:
+        return not native or backend.pairing_product_is_one(native)
+    f = f * _prepared_miller_loop(prepared)
+    return final_exponentiate(f) == FQ12.one()
 
 
 # identity elements
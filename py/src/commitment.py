@@ -1,8 +1,20 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Self
+from itertools import islice
+from typing import Iterable, Iterator, Self
+from src.backends import get_backend, set_backend
 from src.blake2b_224 import generate
-from src.bls12_381 import field_order, g1_point, rng
+from src.bls12_381 import FixedBase, G1Point, double_scalar_mul, field_order, rng
 from src.element import Element
+from src.element_array import ElementArray
+
+# the pedersen generators, their tables are built once and shared process wide
+generator_g = FixedBase(G1Point.generator())
+generator_h = FixedBase(G1Point.generator() * 2)
+
+# below this many values a process pool costs more than it saves
+parallel_threshold = 4096
 
 
 @dataclass
@@ -30,13 +42,114 @@ class Commitment:
     c: Element = field(init=False)
 
     def __post_init__(self) -> None:
-        # this are fixed inside of a commitment
-        g = Element(g1_point(1))
-        h = Element(g1_point(2))
         # unique to this commitment
         if self.r is None:
             self.r = rng()
-        self.c = self.r * g + self.v * h
+        # g and h are fixed inside of a commitment
+        self.c = Element.from_point(
+            double_scalar_mul(self.r, generator_g, self.v, generator_h)
+        )
+
+    @classmethod
+    def commit_many(
+        cls,
+        values: Iterable[int],
+        randomness: Iterable[int] | None = None,
+        workers: int | None = None,
+    ) -> "CommitmentArray":
+        """
+        Commits to many values at once.
+
+        Every commitment is accumulated from the fixed-base tables of g and h,
+        and the whole batch is compressed with one shared inversion into a
+        contiguous array. With workers set, inputs of at least
+        parallel_threshold values are split across a process pool.
+
+        Args:
+            values (Iterable[int]): The values being committed to.
+            randomness (Iterable[int], optional): One random value per value.
+                Generated randomly if not provided.
+            workers (int, optional): The number of worker processes.
+
+        Returns:
+            CommitmentArray: The commitments with their openings.
+        """
+        values = list(values)
+        randomness = _randomness(values, randomness)
+        if workers and len(values) >= parallel_threshold:
+            size = -(-len(values) // workers)
+            chunks = [
+                (values[i : i + size], randomness[i : i + size])
+                for i in range(0, len(values), size)
+            ]
+            with ProcessPoolExecutor(workers) as pool:
+                backend = get_backend().name
+                data = b"".join(
+                    pool.map(_commit_chunk, *zip(*chunks), [backend] * len(chunks))
+                )
+            commitments = ElementArray._trusted(data, G1Point)
+        else:
+            commitments = _commit_array(values, randomness)
+        return CommitmentArray(values, randomness, commitments)
+
+    @classmethod
+    def commit_stream(
+        cls,
+        values: Iterable[int],
+        randomness: Iterable[int] | None = None,
+        chunk_size: int = 4096,
+        workers: int | None = None,
+    ) -> Iterator["CommitmentArray"]:
+        """
+        Commits to a stream of values and yields the commitments in chunks.
+
+        Only a bounded number of chunks is held at any time, so the memory
+        used stays flat however many values are streamed through. With
+        workers set the chunks are committed in a process pool, at most two
+        per worker in flight, and still yielded in input order.
+
+        Args:
+            values (Iterable[int]): The values being committed to.
+            randomness (Iterable[int], optional): One random value per value.
+                Generated randomly if not provided.
+            chunk_size (int, optional): The values per chunk. Defaults to 4096.
+            workers (int, optional): The number of worker processes.
+
+        Yields:
+            CommitmentArray: The commitments of each chunk with their openings.
+        """
+        values = iter(values)
+        if randomness is not None:
+            randomness = iter(randomness)
+
+        def chunks() -> Iterator[tuple[list[int], list[int]]]:
+            while chunk := list(islice(values, chunk_size)):
+                if randomness is None:
+                    yield chunk, _randomness(chunk, None)
+                else:
+                    yield chunk, _randomness(chunk, islice(randomness, len(chunk)))
+
+        if not workers:
+            for chunk, r in chunks():
+                yield CommitmentArray(chunk, r, _commit_array(chunk, r))
+            return
+        backend = get_backend().name
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for chunk, r in chunks():
+                pending.append(
+                    (chunk, r, pool.submit(_commit_chunk, chunk, r, backend))
+                )
+                if len(pending) < 2 * workers:
+                    continue
+                chunk, r, future = pending.popleft()
+                yield CommitmentArray(
+                    chunk, r, ElementArray._trusted(future.result(), G1Point)
+                )
+            for chunk, r, future in pending:
+                yield CommitmentArray(
+                    chunk, r, ElementArray._trusted(future.result(), G1Point)
+                )
 
     def hash(self) -> str:
         return generate(self.c.value)
@@ -44,6 +157,34 @@ class Commitment:
     def __str__(self) -> str:
         return f"Commitment(c={self.c}, r={self.r}, v={self.v})"
 
+    @classmethod
+    def from_blinding(cls, v: int, r: int, r_g: G1Point) -> Self:
+        """
+        Builds a commitment from a precomputed blinding point r * g, so only
+        the value-dependent v * h is left to compute.
+
+        Args:
+            v (int): The value being committed to.
+            r (int): The randomness.
+            r_g (G1Point): The point r * g.
+
+        Returns:
+            Commitment: The commitment to v with randomness r.
+        """
+        if v % field_order == 0:
+            return cls._opened(v, r, Element.from_point(r_g))
+        return cls._opened(v, r, Element.from_point(r_g + generator_h.multiply(v)))
+
+    @classmethod
+    def _opened(cls, v: int, r: int, c: Element) -> Self:
+        # a commitment whose point is already known, e.g. from combining two
+        # others, skips the scalar multiplications in __post_init__
+        commitment = cls.__new__(cls)
+        commitment.v = v
+        commitment.r = r
+        commitment.c = c
+        return commitment
+
     def __add__(self, other) -> Self:
         if not isinstance(other, Commitment):
             return NotImplemented
@@ -51,18 +192,17 @@ class Commitment:
         combined_r = (self.r + other.r) % field_order
         # Add the v values
         combined_v = (self.v + other.v) % field_order
-        # Create a new Commitment instance with combined values
-        return Commitment(combined_v, combined_r)
+        # the commitment is additively homomorphic, so the points just add up
+        return Commitment._opened(combined_v, combined_r, self.c + other.c)
 
     def __sub__(self, other) -> Self:
         if not isinstance(other, Commitment):
             return NotImplemented
-        # Add the r values
+        # Subtract the r values
         combined_r = (self.r - other.r) % field_order
-        # Add the v values
+        # Subtract the v values
         combined_v = (self.v - other.v) % field_order
-        # Create a new Commitment instance with combined values
-        return Commitment(combined_v, combined_r)
+        return Commitment._opened(combined_v, combined_r, self.c + ~other.c)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Commitment):
@@ -77,6 +217,94 @@ class Commitment:
         beta = generate(alpha_commitment.c.value + r_commitment.c.value)
         b = int(beta, 16)
         z = (alpha + b * self.r) % field_order
-        z_commitment = Commitment(0, z)
-        right = alpha_commitment.c + (b * r_commitment.c)
-        return z_commitment.c.value == right.value
+        # z * g - b * r_commitment must land back on alpha_commitment
+        left = double_scalar_mul(z, generator_g, b, -r_commitment.c.point())
+        return left == alpha_commitment.c.point()
+
+
+@dataclass
+class CommitmentArray:
+    """
+    Many commitments with their openings, the points kept as one contiguous
+    ElementArray of compressed bytes.
+
+    Attributes:
+        values (list[int]): The committed values.
+        randomness (list[int]): The random value of each commitment.
+        commitments (ElementArray): The commitment points, in order.
+    """
+
+    values: list[int]
+    randomness: list[int]
+    commitments: ElementArray
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Commitment:
+        return Commitment._opened(
+            self.values[index], self.randomness[index], self.commitments[index]
+        )
+
+    def __iter__(self) -> Iterator[Commitment]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def blinding_pair() -> tuple[int, G1Point]:
+    """
+    Draws fresh randomness r together with its blinding point r * g.
+
+    Returns:
+        tuple[int, G1Point]: The pair (r, r * g).
+    """
+    r = rng()
+    return r, generator_g.multiply(r)
+
+
+def blinding_pairs(count: int) -> list[tuple[int, G1Point]]:
+    """
+    Draws many blinding pairs at once, normalized together so that later
+    additions of the blinding points take the mixed path.
+
+    Args:
+        count (int): The number of pairs.
+
+    Returns:
+        list[tuple[int, G1Point]]: The pairs (r, r * g).
+    """
+    ops = G1Point._ops()
+    scalars = [rng() for _ in range(count)]
+    points = ops.normalize_many(
+        [generator_g._accumulate(ops, ops.zero, r) for r in scalars]
+    )
+    return [(r, G1Point(pt, ops)) for r, pt in zip(scalars, points)]
+
+
+def _randomness(values: list[int], randomness: Iterable[int] | None) -> list[int]:
+    if randomness is None:
+        return [rng() for _ in values]
+    randomness = list(randomness)
+    if len(randomness) != len(values):
+        raise ValueError("commit_many needs exactly one random value per value")
+    return randomness
+
+
+def _commit_array(values: list[int], randomness: list[int]) -> ElementArray:
+    # r * g + v * h straight from both tables, then one shared inversion
+    ops = G1Point._ops()
+    zero = ops.zero
+    points = [
+        G1Point(
+            generator_h._accumulate(ops, generator_g._accumulate(ops, zero, r), v), ops
+        )
+        for v, r in zip(values, randomness)
+    ]
+    return ElementArray.from_points(points, G1Point)
+
+
+def _commit_chunk(values: list[int], randomness: list[int], backend: str) -> bytes:
+    # runs in a worker process, the tables are built once per worker
+    if get_backend().name != backend:
+        set_backend(backend)
+    return _commit_array(values, randomness).to_bytes()
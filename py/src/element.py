@@ -1,17 +1,90 @@
-from dataclasses import dataclass
 from typing import Self
 from src.blake2b_224 import generate
-from src.bls12_381 import combine, compress, invert, scale, uncompress
+from src.bls12_381 import G1Point, G2Point, field_order, msm, uncompress
 
 
-@dataclass
 class Element:
-    value: str
+    """
+    A BLS12-381 group element that is both its compressed bytes and its point.
+
+    Either form is computed from the other only when it is first needed and
+    is then kept, so a chain of operations stays on projective points and is
+    only encoded when its value is read. The slots keep an element to the
+    48 or 96 compressed bytes plus the point object.
+
+    Arithmetic does not compute anything. It builds a linear combination of
+    the points it started from, and the combination is evaluated the first
+    time its point, value, equality or hash is needed, as one multi-scalar
+    multiplication with a single normalization when the value is encoded.
+    """
+
+    __slots__ = ("_data", "_point", "_terms")
+
+    def __init__(self, value: str) -> None:
+        self._data: bytes | None = bytes.fromhex(value)
+        self._point: G1Point | G2Point | None = None
+        self._terms: list[tuple[G1Point | G2Point, int]] | None = None
+
+    @classmethod
+    def from_point(cls, point: G1Point | G2Point) -> Self:
+        # the bytes are only encoded when they are first read
+        element = cls.__new__(cls)
+        element._data = None
+        element._point = point
+        element._terms = None
+        return element
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        element = cls.__new__(cls)
+        element._data = bytes(data)
+        element._point = None
+        element._terms = None
+        return element
+
+    @classmethod
+    def _combination(cls, terms: list[tuple[G1Point | G2Point, int]]) -> Self:
+        element = cls.__new__(cls)
+        element._data = None
+        element._point = None
+        element._terms = terms
+        return element
+
+    def _linear(self) -> list[tuple[G1Point | G2Point, int]]:
+        # the element as (point, scalar) terms
+        if self._terms is not None:
+            return self._terms
+        return [(self.point(), 1)]
+
+    def _group(self) -> type:
+        return type(self._terms[0][0]) if self._terms else type(self.point())
+
+    @property
+    def value(self) -> str:
+        return self.to_bytes().hex()
+
+    def to_bytes(self) -> bytes:
+        if self._data is None:
+            self._data = self.point().to_bytes()
+        return self._data
+
+    def point(self) -> G1Point | G2Point:
+        # evaluate or decode once and keep the projective point
+        if self._point is None:
+            if self._terms is not None:
+                self._point = _evaluate(self._terms)
+                self._terms = None
+            else:
+                group = G1Point if len(self._data) == 48 else G2Point
+                self._point = group.from_bytes(self._data)
+        return self._point
 
     def compressed(self) -> str:
-        return compress(self.value)
+        return self.value
 
     def uncompressed(self) -> tuple:
+        if self._point is not None:
+            return self._point.reference()
         return uncompress(self.value)
 
     def hash(self) -> str:
@@ -20,23 +93,60 @@ class Element:
     def __str__(self) -> str:
         return self.value
 
+    def __repr__(self) -> str:
+        return f"Element(value={self.value!r})"
+
     def __add__(self, other) -> Self:
-        if not isinstance(other, Element):
+        if not isinstance(other, Element) or other._group() is not self._group():
             return NotImplemented
-        return Element(combine(self.value, other.value))
+        return Element._combination(self._linear() + other._linear())
 
     def __mul__(self, other) -> Self:
         if not isinstance(other, int):
             return NotImplemented
-        return Element(scale(self.value, other))
+        scalar = other % field_order
+        return Element._combination(
+            [(point, s * scalar % field_order) for point, s in self._linear()]
+        )
 
     def __rmul__(self, other) -> Self:
         return self.__mul__(other)
 
     def __invert__(self) -> Self:
-        return Element(invert(self.value))
+        return Element._combination(
+            [(point, -s % field_order) for point, s in self._linear()]
+        )
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Element):
             return NotImplemented
-        return self.value == other.value
+        if self._data is not None and other._data is not None:
+            return self._data == other._data
+        # compare projectively rather than encoding either side
+        return self.point() == other.point()
+
+    def __hash__(self) -> int:
+        return hash(self.to_bytes())
+
+
+def _evaluate(terms: list[tuple[G1Point | G2Point, int]]) -> G1Point | G2Point:
+    # the same point object showing up more than once is one term
+    merged: dict[int, list] = {}
+    for point, scalar in terms:
+        entry = merged.setdefault(id(point), [point, 0])
+        entry[1] = (entry[1] + scalar) % field_order
+    acc = type(terms[0][0]).identity()
+    points = []
+    scalars = []
+    for point, scalar in merged.values():
+        # plain sums and differences need no multiplication at all
+        if scalar == 1:
+            acc = acc + point
+        elif scalar == field_order - 1:
+            acc = acc - point
+        elif scalar:
+            points.append(point)
+            scalars.append(scalar)
+    if points:
+        acc = acc + msm(points, scalars)
+    return acc
@@ -0,0 +1,181 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple
+
+from src.backends import get_backend, set_backend
+from src.commitment import generator_g, generator_h
+from src.range import Range, RangeProof
+
+
+class ProofResult(NamedTuple):
+    """
+    The outcome of one proof job, either a proof or the error it raised.
+
+    Attributes:
+        index (int): The position of the job in the input.
+        proof (RangeProof | None): The proof, None if the job failed.
+        error (str | None): The error message, None if the job succeeded.
+    """
+
+    index: int
+    proof: RangeProof | None
+    error: str | None
+
+
+class ProverPool:
+    """
+    Generates range proofs across a pool of worker processes.
+
+    Each worker selects the parent's backend and builds the fixed-base tables
+    once when it starts. Jobs are (value, lower_bound, upper_bound) triples,
+    sent in chunks to amortize pickling, and the jobs of a chunk that share an
+    interval are proven together with Range.create_proofs. A job that fails,
+    e.g. a value outside its interval, only fails its own result. At most two
+    chunks per worker are in flight, so any number of jobs can be streamed
+    through.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        chunk_size (int): The jobs sent to a worker at once.
+    """
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 32) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._cancelled = threading.Event()
+        self._executor = ProcessPoolExecutor(
+            self.workers, initializer=_initialize, initargs=(get_backend().name,)
+        )
+
+    def prove(
+        self, jobs: Iterable[tuple[int, int, int]], ordered: bool = True
+    ) -> Iterator[ProofResult]:
+        """
+        Proves every job and yields the results as they become available.
+
+        Args:
+            jobs (Iterable[tuple[int, int, int]]): The (value, lower_bound,
+                upper_bound) triples.
+            ordered (bool, optional): Yield in input order, otherwise in
+                completion order. Defaults to True.
+
+        Yields:
+            ProofResult: One result per job until the pool is cancelled.
+        """
+        self._cancelled.clear()
+        jobs = iter(jobs)
+        pending: deque[tuple[Future, int, list]] = deque()
+        start = 0
+        try:
+            while not self._cancelled.is_set():
+                while len(pending) < 2 * self.workers:
+                    chunk = list(islice(jobs, self.chunk_size))
+                    if not chunk:
+                        break
+                    future = self._executor.submit(_prove_chunk, start, chunk)
+                    pending.append((future, start, chunk))
+                    start += len(chunk)
+                if not pending:
+                    return
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(
+                        [future for future, *_ in pending], return_when=FIRST_COMPLETED
+                    )
+                    done = [item for item in pending if item[0] in finished]
+                    for item in done:
+                        pending.remove(item)
+                for future, first, chunk in done:
+                    yield from _results(future, first, chunk)
+        finally:
+            # stopping early, by cancel or by closing the generator, drops
+            # the chunks that have not started yet
+            for future, *_ in pending:
+                future.cancel()
+
+    def prove_all(self, jobs: Iterable[tuple[int, int, int]]) -> list[ProofResult]:
+        return list(self.prove(jobs))
+
+    def cancel(self) -> None:
+        """
+        Stops a running prove after the results already being yielded.
+        """
+        self._cancelled.set()
+
+    def close(self) -> None:
+        self._cancelled.set()
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "ProverPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _initialize(backend: str) -> None:
+    # runs once in every worker process
+    set_backend(backend)
+    generator_g.table()
+    generator_h.table()
+
+
+def _results(future: Future, first: int, chunk: list) -> Iterator[ProofResult]:
+    try:
+        results = future.result()
+    except Exception as error:
+        # a worker that died takes only its own chunk down
+        results = [
+            ProofResult(index, None, f"{type(error).__name__}: {error}")
+            for index in range(first, first + len(chunk))
+        ]
+    yield from results
+
+
+def _prove_chunk(first: int, chunk: list[tuple[int, int, int]]) -> list[ProofResult]:
+    results: list[ProofResult | None] = [None] * len(chunk)
+    intervals: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for offset, job in enumerate(chunk):
+        try:
+            value, lower_bound, upper_bound = job
+            if not isinstance(value, int) or not all(
+                bound is None or isinstance(bound, int)
+                for bound in (lower_bound, upper_bound)
+            ):
+                raise TypeError("Proof jobs take integer values and bounds")
+            lower_bound, upper_bound = Range._bounds(lower_bound, upper_bound)
+            Range._differences(value, lower_bound, upper_bound)
+        except (TypeError, ValueError) as error:
+            results[offset] = ProofResult(first + offset, None, str(error))
+            continue
+        intervals.setdefault((lower_bound, upper_bound), []).append((offset, value))
+    for (lower_bound, upper_bound), entries in intervals.items():
+        try:
+            proofs = Range.create_proofs(
+                [value for _, value in entries], lower_bound, upper_bound
+            )
+        except Exception:
+            # prove the interval job by job so a failure stays with its job
+            proofs = [
+                _prove_one(value, lower_bound, upper_bound) for _, value in entries
+            ]
+        for (offset, _), proof in zip(entries, proofs):
+            if isinstance(proof, Exception):
+                error = f"{type(proof).__name__}: {proof}"
+                results[offset] = ProofResult(first + offset, None, error)
+            else:
+                results[offset] = ProofResult(first + offset, proof, None)
+    return results
+
+
+def _prove_one(
+    value: int, lower_bound: int, upper_bound: int
+) -> RangeProof | Exception:
+    try:
+        return Range.create_proofs([value], lower_bound, upper_bound)[0]
+    except Exception as error:
+        return error
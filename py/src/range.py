@@ -1,10 +1,88 @@
 from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, Self
 
-from src.blake2b_224 import fiat_shamir_heuristic, generate
-from src.bls12_381 import field_order, g2_point, invert, pair, rng
-from src.commitment import Commitment
+from src.blake2b_224 import fiat_shamir_digest, generate
+from src.bls12_381 import (
+    ON_CURVE_ONLY,
+    G1Point,
+    G2Point,
+    PreparedG2,
+    compress_many,
+    double_scalar_mul,
+    field_order,
+    msm,
+    pairing_product_is_one,
+    random_weight,
+)
+from src.blinding_pool import BlindingPool
+from src.commitment import (
+    Commitment,
+    blinding_pair,
+    blinding_pairs,
+    generator_g,
+    generator_h,
+)
 from src.element import Element
-from src.util import hexify
+from src.util import int_to_bytes
+
+# every pairing uses the G2 generator, its line functions are computed once
+prepared_q = PreparedG2(G2Point.generator())
+
+
+@dataclass(frozen=True, slots=True)
+class RangeProof:
+    """
+    A range proof as raw bytes. The points are compressed G1 points and the
+    Schnorr responses Za and Zb are the shortest big-endian bytes of the
+    integers. Hex only appears when the proof is presented, through to_dict.
+
+    Attributes:
+        Y, D, R, W, L, A, B (bytes): The commitments of the range equation.
+        Za, Zb (bytes): The Schnorr responses for the upper and lower bound.
+        ac, bc (bytes): The Schnorr nonce commitments.
+    """
+
+    Y: bytes
+    D: bytes
+    R: bytes
+    W: bytes
+    L: bytes
+    A: bytes
+    B: bytes
+    Za: bytes
+    ac: bytes
+    Zb: bytes
+    bc: bytes
+
+    @classmethod
+    def from_dict(cls, proof: dict) -> Self:
+        return cls(**{key: bytes.fromhex(proof[key]) for key in _PROOF_KEYS})
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key).hex() for key in _PROOF_KEYS}
+
+
+_PROOF_KEYS = ("Y", "D", "R", "W", "L", "A", "B", "Za", "ac", "Zb", "bc")
+
+
+def _as_proof(proof: dict | RangeProof) -> RangeProof:
+    # the hex dictionaries are accepted everywhere a proof is
+    return proof if isinstance(proof, RangeProof) else RangeProof.from_dict(proof)
+
+
+@dataclass
+class _ProofTerms:
+    """
+    The decoded points and challenges of one proof, ready to be folded into a
+    batch check. Each Schnorr entry is (z, b, bound, -commitment, -nonce) for
+    the equation z * g + b * bound * h - b * commitment - nonce = 0, and the
+    range equation is left - right = 0.
+    """
+
+    schnorr: list[tuple[int, int, int, G1Point, G1Point]]
+    left: G1Point
+    right: G1Point
 
 
 @dataclass
@@ -18,15 +96,22 @@ class Range:
 
     It is assumed that the lower and upper bound values are public.
 
+    Every commitment is built from a blinding pair (r, r * g). Given a
+    BlindingPool those pairs were computed offline, and constructing the range
+    and its proof only computes the value-dependent v * h terms.
+
     Attributes:
         secret_value (int): The value to be proven within the range.
         lower_bound (int | None): The lower bound of the range.
         upper_bound (int | None): The upper bound of the range.
+        pool (BlindingPool | None): Where the blinding pairs come from. Fresh
+            pairs are computed when it is None.
     """
 
     secret_value: int
     lower_bound: int | None = None
     upper_bound: int | None = None
+    pool: BlindingPool | None = field(default=None, repr=False, compare=False)
 
     A_commit: Commitment = field(init=False)
     B_commit: Commitment = field(init=False)
@@ -37,55 +122,88 @@ class Range:
     right: Commitment = field(init=False)
     left: Commitment = field(init=False)
     Q: Element = field(init=False)
+    _blinding: dict[str, G1Point] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
 
-    def __post_init__(self) -> None:
+    def _pair(self) -> tuple[int, G1Point]:
+        return blinding_pair() if self.pool is None else self.pool.take()
+
+    def _commit(self, name: str, v: int) -> Commitment:
+        # keep r * g, the proof needs it again on its own
+        r, r_g = self._pair()
+        self._blinding[name] = r_g
+        return Commitment.from_blinding(v, r, r_g)
+
+    @staticmethod
+    def _bounds(lower_bound: int | None, upper_bound: int | None) -> tuple[int, int]:
         # if upper bound is not set then it becomes field prime minus one
-        if self.upper_bound is None:
-            self.upper_bound = field_order - 1
+        if upper_bound is None:
+            upper_bound = field_order - 1
         # upper bound cant be larger than the field prime
-        if self.upper_bound > field_order - 1:
+        if upper_bound > field_order - 1:
             raise ValueError(
                 "Invalid Range Proof: Upper bound must be less than field order."
             )
 
         # if the lower bound is not set it becomes zero
-        if self.lower_bound is None:
-            self.lower_bound = 0
+        if lower_bound is None:
+            lower_bound = 0
         # lower bound can't be smaller than zero
-        if self.lower_bound < 0:
+        if lower_bound < 0:
             raise ValueError(
                 "Invalid Range Proof: Lower bound must be greater than or equal to zero."
             )
+        return lower_bound, upper_bound
 
-        # Set up D commitment
-        self.D_commit = Commitment(self.secret_value)
-
-        # Set up Y commitment
-        y = self.upper_bound - self.secret_value
+    @staticmethod
+    def _differences(value: int, lower_bound: int, upper_bound: int) -> tuple[int, int]:
+        y = upper_bound - value
         if y < 0:
             raise ValueError(
                 "Invalid Range Proof: Y value must be greater than or equal to zero."
             )
-        self.Y_commit = Commitment(y)
-
-        # Set up W commitment
-        w = self.secret_value - self.lower_bound
+        w = value - lower_bound
         if w < 0:
             raise ValueError(
                 "Invalid Range Proof: W value must be greater than or equal to zero."
             )
-        self.W_commit = Commitment(w)
+        return y, w
+
+    def __post_init__(self) -> None:
+        self.lower_bound, self.upper_bound = Range._bounds(
+            self.lower_bound, self.upper_bound
+        )
+        y, w = Range._differences(self.secret_value, self.lower_bound, self.upper_bound)
+
+        # Set up D commitment
+        self.D_commit = self._commit("D", self.secret_value)
+
+        # Set up Y commitment
+        self.Y_commit = self._commit("Y", y)
+
+        # Set up W commitment
+        self.W_commit = self._commit("W", w)
 
         # Set up A and B commitments with public randomness
-        self.A_commit = Commitment(self.upper_bound)
-        self.B_commit = Commitment(self.lower_bound)
+        self.A_commit = self._commit("A", self.upper_bound)
+        self.B_commit = self._commit("B", self.lower_bound)
 
         # Set up Q
-        self.Q = Element(g2_point(1))
+        self.Q = Element.from_point(G2Point.generator())
 
         # need to account for the random r values
-        self.right = Commitment(0, self.A_commit.r + self.B_commit.r + self.W_commit.r)
-        self.left = Commitment(0, self.Y_commit.r + self.D_commit.r + self.D_commit.r)
+        blinding = self._blinding
+        self.right = Commitment.from_blinding(
+            0,
+            self.A_commit.r + self.B_commit.r + self.W_commit.r,
+            blinding["A"] + blinding["B"] + blinding["W"],
+        )
+        self.left = Commitment.from_blinding(
+            0,
+            self.Y_commit.r + self.D_commit.r + self.D_commit.r,
+            blinding["Y"] + blinding["D"] + blinding["D"],
+        )
 
     def __str__(self) -> str:
         return f"Range(\nY={self.Y_commit.c},\n{(self.D_commit + self.D_commit).c},\nR={self.right.c},\nW={self.W_commit.c},\nL={self.left.c}\n)"
@@ -97,115 +215,413 @@ class Range:
             r_commitment = self.B_commit - Commitment(self.lower_bound, 0)
         beta = generate(a_c + r_commitment.c.value)
         b = int(beta, 16)
-        z_commitment = Commitment(0, z_a)
-        right = Element(a_c) + (b * r_commitment.c)
-        return z_commitment.c.value == right.value
+        # z_a * g - b * r_commitment must land back on a_c
+        left = double_scalar_mul(z_a, generator_g, b, -r_commitment.c.point())
+        # the nonce commitment is our own, it skips the subgroup check
+        return left == G1Point.from_hex(a_c, ON_CURVE_ONLY)
 
     def prove(self, z_a, a_c, z_b, b_c) -> bool:
         # prove they know the r in A_commit
         check_a = self.schnorr(z_a, a_c, True)
         # prove they know the r in B_commit
         check_b = self.schnorr(z_b, b_c, False)
-        # prove the pairing range proof
-        left_pair = pair(
-            self.Q.value,
-            ((self.Y_commit + self.D_commit + self.D_commit).c + self.right.c).value,
+        # prove the pairing range proof, e(Q, Y + 2D + R) * e(Q, -(A + B + W + L)) = 1
+        check_p = pairing_product_is_one(
+            [
+                (
+                    prepared_q,
+                    (self.Y_commit + self.D_commit + self.D_commit).c.point()
+                    + self.right.c.point(),
+                ),
+                (
+                    prepared_q,
+                    -(
+                        self.A_commit.c.point()
+                        + self.B_commit.c.point()
+                        + self.W_commit.c.point()
+                        + self.left.c.point()
+                    ),
+                ),
+            ]
         )
-        right_pair = pair(
-            self.Q.value,
-            (self.A_commit.c + self.B_commit.c + self.W_commit.c + self.left.c).value,
-        )
-        check_p = left_pair == right_pair
         # Verifying that the commitments are consistent with the expected range proof
         return check_p and check_a and check_b
 
     def generate_proof(self) -> dict:
-        # do the schnorr proofs
-        r_upper_commitment = self.A_commit - Commitment(self.upper_bound, 0)
-        r_lower_commitment = self.B_commit - Commitment(self.lower_bound, 0)
-
-        alpha = rng()
-        alpha_upper_commitment = Commitment(0, alpha)
-        beta = fiat_shamir_heuristic(
-            Commitment(0, 1).c.value,
-            alpha_upper_commitment.c.value,
-            r_upper_commitment.c.value,
+        return self.create_proof().to_dict()
+
+    def create_proof(self) -> RangeProof:
+        """
+        Generates the range proof with every field as bytes.
+
+        Returns:
+            RangeProof: The proof, generate_proof returns its hex dictionary.
+        """
+        # do the schnorr proofs, r * g of A and B is their blinding point
+        blinding = self._blinding
+        r_upper_commitment = Commitment.from_blinding(0, self.A_commit.r, blinding["A"])
+        r_lower_commitment = Commitment.from_blinding(0, self.B_commit.r, blinding["B"])
+        alpha_upper, alpha_g = self._pair()
+        alpha_upper_commitment = Commitment.from_blinding(0, alpha_upper, alpha_g)
+        alpha_lower, alpha_g = self._pair()
+        alpha_lower_commitment = Commitment.from_blinding(0, alpha_lower, alpha_g)
+        double_d_commit = self.D_commit + self.D_commit
+
+        # serialize every transcript and proof point in one pass
+        compress_many(
+            [
+                commitment.c.point()
+                for commitment in [
+                    r_upper_commitment,
+                    r_lower_commitment,
+                    alpha_upper_commitment,
+                    alpha_lower_commitment,
+                    self.Y_commit,
+                    double_d_commit,
+                    self.right,
+                    self.W_commit,
+                    self.left,
+                    self.A_commit,
+                    self.B_commit,
+                ]
+            ]
         )
-        b = int(beta, 16)
-        z_a = (alpha + b * self.A_commit.r) % field_order
-        a_c = alpha_upper_commitment.c.value
-
-        alpha = rng()
-        alpha_lower_commitment = Commitment(0, alpha)
-        beta = fiat_shamir_heuristic(
-            Commitment(0, 1).c.value,
-            alpha_lower_commitment.c.value,
-            r_lower_commitment.c.value,
+        g = generator_g.point.to_bytes()
+
+        a_c = alpha_upper_commitment.c.to_bytes()
+        z_a = _response(
+            g, a_c, r_upper_commitment.c.to_bytes(), alpha_upper, self.A_commit.r
         )
-        b = int(beta, 16)
-        z_b = (alpha + b * self.B_commit.r) % field_order
-        b_c = alpha_lower_commitment.c.value
-
-        data = {
-            "Y": self.Y_commit.c.value,
-            "D": (self.D_commit + self.D_commit).c.value,
-            "R": self.right.c.value,
-            "W": self.W_commit.c.value,
-            "L": self.left.c.value,
-            "A": self.A_commit.c.value,
-            "B": self.B_commit.c.value,
-            "Za": hexify(z_a),
-            "ac": a_c,
-            "Zb": hexify(z_b),
-            "bc": b_c,
-        }
-        return data
+
+        b_c = alpha_lower_commitment.c.to_bytes()
+        z_b = _response(
+            g, b_c, r_lower_commitment.c.to_bytes(), alpha_lower, self.B_commit.r
+        )
+
+        return RangeProof(
+            Y=self.Y_commit.c.to_bytes(),
+            D=double_d_commit.c.to_bytes(),
+            R=self.right.c.to_bytes(),
+            W=self.W_commit.c.to_bytes(),
+            L=self.left.c.to_bytes(),
+            A=self.A_commit.c.to_bytes(),
+            B=self.B_commit.c.to_bytes(),
+            Za=int_to_bytes(z_a),
+            ac=a_c,
+            Zb=int_to_bytes(z_b),
+            bc=b_c,
+        )
+
+    @staticmethod
+    def create_proofs(
+        values: Iterable[int],
+        lower_bound: int | None = None,
+        upper_bound: int | None = None,
+        pool: BlindingPool | None = None,
+    ) -> list[RangeProof]:
+        """
+        Generates one range proof per value, all for the same interval.
+
+        The bound-dependent points upper * h and lower * h are computed once
+        for the batch, and each value costs a single table multiplication
+        v * h since y * h and w * h follow from it by subtraction. The
+        blinding points are drawn in one normalized batch unless a pool is
+        given, and every point of every proof is compressed with one shared
+        inversion.
+
+        Args:
+            values (Iterable[int]): The secret values.
+            lower_bound (int | None, optional): The shared lower bound.
+            upper_bound (int | None, optional): The shared upper bound.
+            pool (BlindingPool, optional): Where the blinding pairs come from.
+
+        Returns:
+            list[RangeProof]: The proofs, in input order.
+        """
+        lower_bound, upper_bound = Range._bounds(lower_bound, upper_bound)
+        values = list(values)
+        for value in values:
+            Range._differences(value, lower_bound, upper_bound)
+        if not values:
+            return []
+        upper_h = generator_h.multiply(upper_bound)
+        lower_h = generator_h.multiply(lower_bound)
+        if pool is None:
+            pairs = iter(blinding_pairs(7 * len(values)))
+        else:
+            pairs = iter([pool.take() for _ in range(7 * len(values))])
+
+        openings = []
+        points = []
+        for value in values:
+            (r_d, d_g), (r_y, y_g), (r_w, w_g), (r_a, a_g), (r_b, b_g) = islice(
+                pairs, 5
+            )
+            (alpha_a, alpha_a_g), (alpha_b, alpha_b_g) = islice(pairs, 2)
+            value_h = generator_h.multiply(value)
+            d = d_g + value_h
+            points.append(
+                [
+                    y_g + (upper_h - value_h),
+                    d + d,
+                    a_g + b_g + w_g,
+                    w_g + (value_h - lower_h),
+                    y_g + d_g + d_g,
+                    a_g + upper_h,
+                    b_g + lower_h,
+                    alpha_a_g,
+                    alpha_b_g,
+                ]
+            )
+            openings.append((a_g, b_g, r_a, r_b, alpha_a, alpha_b))
+        compress_many(
+            [point for row in points for point in row]
+            + [point for row in openings for point in row[:2]]
+        )
+
+        g = generator_g.point.to_bytes()
+        proofs = []
+        for row, (a_g, b_g, r_a, r_b, alpha_a, alpha_b) in zip(points, openings):
+            Y, D, R, W, L, A, B, a_c, b_c = (point.to_bytes() for point in row)
+            proofs.append(
+                RangeProof(
+                    Y=Y,
+                    D=D,
+                    R=R,
+                    W=W,
+                    L=L,
+                    A=A,
+                    B=B,
+                    Za=int_to_bytes(_response(g, a_c, a_g.to_bytes(), alpha_a, r_a)),
+                    ac=a_c,
+                    Zb=int_to_bytes(_response(g, b_c, b_g.to_bytes(), alpha_b, r_b)),
+                    bc=b_c,
+                )
+            )
+        return proofs
+
+    @staticmethod
+    def generate_proofs(
+        values: Iterable[int],
+        lower_bound: int | None = None,
+        upper_bound: int | None = None,
+        pool: BlindingPool | None = None,
+    ) -> list[dict]:
+        return [
+            proof.to_dict()
+            for proof in Range.create_proofs(values, lower_bound, upper_bound, pool)
+        ]
+
+    @staticmethod
+    def stream_proofs(
+        values: Iterable[int],
+        lower_bound: int | None = None,
+        upper_bound: int | None = None,
+        chunk_size: int = 256,
+        pool: BlindingPool | None = None,
+    ) -> Iterator[dict]:
+        """
+        Generates proofs like generate_proofs, a chunk of values at a time,
+        so any number of values can be streamed through in bounded memory.
+
+        Args:
+            values (Iterable[int]): The secret values.
+            lower_bound (int | None, optional): The shared lower bound.
+            upper_bound (int | None, optional): The shared upper bound.
+            chunk_size (int, optional): The values per batch. Defaults to 256.
+            pool (BlindingPool, optional): Where the blinding pairs come from.
+
+        Yields:
+            dict: One proof per value, in input order.
+        """
+        values = iter(values)
+        while chunk := list(islice(values, chunk_size)):
+            yield from Range.generate_proofs(chunk, lower_bound, upper_bound, pool)
 
     @staticmethod
-    def verify_proof(proof, lower_bound, upper_bound) -> bool:
+    def verify_proof(proof, lower_bound, upper_bound, mode: str = "pairing") -> bool:
+        """
+        Verifies a proof from generate_proof against public bounds.
+
+        Both sides of the range equation are paired with the same Q, and the
+        pairing is non-degenerate in its G1 argument, so the pairing check is
+        equivalent to the G1 equality Y + D + R == A + B + W + L. The default
+        "pairing" mode keeps parity with the on-chain validator, while "fast"
+        compares the points directly and reaches the same verdict for points
+        in the prime-order subgroup. Every proof point is decoded with full
+        validation, and the decompression cache remembers the result, so each
+        distinct point is subgroup checked once however often it is verified.
+
+        Args:
+            proof (dict | RangeProof): The proof as returned by generate_proof
+                or create_proof.
+            lower_bound (int): The public lower bound.
+            upper_bound (int): The public upper bound.
+            mode (str, optional): Either "pairing" or "fast". Defaults to "pairing".
+
+        Returns:
+            bool: True if the proof is valid.
+        """
+        if mode not in ("pairing", "fast"):
+            raise ValueError(f"Unknown verification mode: {mode}")
+        proof = _as_proof(proof)
+        # decode and fully validate every proof point once and stay
+        # projective from here on
+        Y = G1Point.from_bytes(proof.Y)
+        D = G1Point.from_bytes(proof.D)
+        R = G1Point.from_bytes(proof.R)
+        W = G1Point.from_bytes(proof.W)
+        L = G1Point.from_bytes(proof.L)
+        A = G1Point.from_bytes(proof.A)
+        B = G1Point.from_bytes(proof.B)
+        g = generator_g.point.to_bytes()
         #
         # Verify A
         #
-        r_upper_commitment = Element(proof["A"]) + Element(
-            invert(Commitment(upper_bound, 0).c.value)
-        )
-        beta = fiat_shamir_heuristic(
-            Commitment(0, 1).c.value, proof["ac"], r_upper_commitment.value
-        )
-        b = int(beta, 16)
-        z_commitment = Commitment(0, int(proof["Za"], 16))
-        right = Element(proof["ac"]) + (b * r_upper_commitment)
-        check_a = z_commitment.c.value == right.value
+        r_upper_commitment = A - generator_h.multiply(upper_bound)
+        beta = fiat_shamir_digest(g, proof.ac, r_upper_commitment.to_bytes())
+        b = int.from_bytes(beta, "big")
+        z = int.from_bytes(proof.Za, "big")
+        left = double_scalar_mul(z, generator_g, b, -r_upper_commitment)
+        check_a = left == G1Point.from_bytes(proof.ac)
         #
         # Verify B
         #
-        r_lower_commitment = Element(proof["B"]) + Element(
-            invert(Commitment(lower_bound, 0).c.value)
-        )
-        beta = fiat_shamir_heuristic(
-            Commitment(0, 1).c.value, proof["bc"], r_lower_commitment.value
-        )
-        b = int(beta, 16)
-        z_commitment = Commitment(0, int(proof["Zb"], 16))
-        right = Element(proof["bc"]) + (b * r_lower_commitment)
-        check_b = z_commitment.c.value == right.value
+        r_lower_commitment = B - generator_h.multiply(lower_bound)
+        beta = fiat_shamir_digest(g, proof.bc, r_lower_commitment.to_bytes())
+        b = int.from_bytes(beta, "big")
+        z = int.from_bytes(proof.Zb, "big")
+        left = double_scalar_mul(z, generator_g, b, -r_lower_commitment)
+        check_b = left == G1Point.from_bytes(proof.bc)
         #
         # Verify Pairing
         #
-        Q = Element(g2_point(1))
-        left_pair = pair(
-            Q.value,
-            (Element(proof["Y"]) + Element(proof["D"]) + Element(proof["R"])).value,
-        )
-        right_pair = pair(
-            Q.value,
-            (
-                Element(proof["A"])
-                + Element(proof["B"])
-                + Element(proof["W"])
-                + Element(proof["L"])
-            ).value,
-        )
-        check_p = left_pair == right_pair
+        if mode == "fast":
+            check_p = Y + D + R == A + B + W + L
+        else:
+            # mirrors the on-chain check e(Q, Y + D + R) * e(-Q, A + B + W + L) = 1,
+            # with the sign moved onto the G1 side so both pairs share prepared Q
+            check_p = pairing_product_is_one(
+                [(prepared_q, Y + D + R), (prepared_q, -(A + B + W + L))]
+            )
         # Verifying that the commitments are consistent with the expected range proof
         return check_a and check_b and check_p
+
+    @staticmethod
+    def _proof_terms(proofs_with_bounds) -> list[tuple[int, _ProofTerms]]:
+        decoded = []
+        for index, (proof, lower_bound, upper_bound) in enumerate(proofs_with_bounds):
+            try:
+                proof = _as_proof(proof)
+                Y, D, R, W, L, A, B, a_c, b_c = (
+                    G1Point.from_bytes(data)
+                    for data in [
+                        proof.Y,
+                        proof.D,
+                        proof.R,
+                        proof.W,
+                        proof.L,
+                        proof.A,
+                        proof.B,
+                        proof.ac,
+                        proof.bc,
+                    ]
+                )
+                schnorr = [
+                    (A, upper_bound, int.from_bytes(proof.Za, "big"), a_c, proof.ac),
+                    (B, lower_bound, int.from_bytes(proof.Zb, "big"), b_c, proof.bc),
+                ]
+                r_commitments = [
+                    commitment - generator_h.multiply(bound)
+                    for commitment, bound, *_ in schnorr
+                ]
+            except (KeyError, TypeError, ValueError):
+                # a malformed proof fails on its own and stays out of the batch
+                continue
+            decoded.append((index, schnorr, r_commitments, Y + D + R, A + B + W + L))
+        # the fiat-shamir inputs of the whole batch share one inversion
+        compress_many([point for item in decoded for point in item[2]])
+        g = generator_g.point.to_bytes()
+        terms = []
+        for index, schnorr, r_commitments, left, right in decoded:
+            equations = []
+            for (commitment, bound, z, nonce, nonce_bytes), r_commitment in zip(
+                schnorr, r_commitments
+            ):
+                beta = fiat_shamir_digest(g, nonce_bytes, r_commitment.to_bytes())
+                b = int.from_bytes(beta, "big")
+                equations.append((z, b, bound, -commitment, -nonce))
+            terms.append((index, _ProofTerms(equations, left, right)))
+        return terms
+
+    @staticmethod
+    def _batch_holds(terms: list[_ProofTerms], mode: str) -> bool:
+        # every equation gets its own random weight before they are summed up
+        g_scalar = 0
+        h_scalar = 0
+        points = []
+        scalars = []
+        for term in terms:
+            for z, b, bound, neg_commitment, neg_nonce in term.schnorr:
+                weight = random_weight()
+                g_scalar += weight * z
+                h_scalar += weight * b * bound
+                points += [neg_commitment, neg_nonce]
+                scalars += [weight * b, weight]
+        range_weights = [random_weight() for _ in terms]
+        if mode == "fast":
+            for term, weight in zip(terms, range_weights):
+                points += [term.left, -term.right]
+                scalars += [weight, weight]
+            points += [generator_g, generator_h]
+            scalars += [g_scalar, h_scalar]
+            return msm(points, scalars).is_identity()
+        points += [generator_g, generator_h]
+        scalars += [g_scalar, h_scalar]
+        if not msm(points, scalars).is_identity():
+            return False
+        left = msm([term.left for term in terms], range_weights)
+        right = msm([term.right for term in terms], range_weights)
+        return pairing_product_is_one([(prepared_q, left), (prepared_q, -right)])
+
+    @staticmethod
+    def verify_batch(proofs_with_bounds, mode: str = "pairing") -> list[bool]:
+        """
+        Verifies many proofs at once and reports a verdict for each of them.
+
+        Every Schnorr equation and every range equation is scaled by a random
+        128-bit weight and the weighted equations are summed, so the whole
+        batch is one multi-scalar multiplication plus, in "pairing" mode, one
+        pairing product. A batch that fails is split in half until the bad
+        proofs are isolated. Points are decoded exactly as in verify_proof,
+        and the combination relies on their subgroup check: a point with a
+        small-order component would cancel out of the weighted sum far more
+        often than the random weights allow.
+
+        Args:
+            proofs_with_bounds (list[tuple[dict | RangeProof, int, int]]): The (proof, lower_bound, upper_bound) triples.
+            mode (str, optional): Either "pairing" or "fast". Defaults to "pairing".
+
+        Returns:
+            list[bool]: The verdict of each proof, in input order.
+        """
+        if mode not in ("pairing", "fast"):
+            raise ValueError(f"Unknown verification mode: {mode}")
+        verdicts = [False] * len(proofs_with_bounds)
+        batch = Range._proof_terms(proofs_with_bounds)
+        pending = [batch] if batch else []
+        while pending:
+            group = pending.pop()
+            if Range._batch_holds([term for _, term in group], mode):
+                for index, _ in group:
+                    verdicts[index] = True
+            elif len(group) > 1:
+                middle = len(group) // 2
+                pending += [group[middle:], group[:middle]]
+        return verdicts
+
+
+def _response(g: bytes, nonce: bytes, r_commitment: bytes, alpha: int, r: int) -> int:
+    # the schnorr response z = alpha + b * r for the fiat-shamir challenge b
+    b = int.from_bytes(fiat_shamir_digest(g, nonce, r_commitment), "big")
+    return (alpha + b * r) % field_order
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.backends import get_backend, set_backend
+from src.blinding_pool import BlindingPool
+from src.commitment import generator_g, generator_h
+from src.range import Range, prepared_q
+
+# the longest request line, a batch-verify carries many proofs
+request_limit = 16 * 1024 * 1024
+
+# warm state of a worker process, set up once by _initialize
+_pool: BlindingPool | None = None
+
+
+class ProofService:
+    """
+    A long-running prover and verifier that keeps its precomputed state warm.
+
+    Clients send one JSON request per line and get one JSON response per line,
+    tagged with the request id and possibly out of order. The operations are:
+
+    - {"op": "prove", "value": v, "lower": l, "upper": u} -> {"proof": {...}}
+    - {"op": "verify", "proof": {...}, "lower": l, "upper": u} -> {"valid": bool}
+    - {"op": "batch-verify", "proofs": [{"proof": {...}, "lower": l,
+      "upper": u}, ...]} -> {"valid": [bool, ...]}
+
+    Verification takes an optional "mode", "pairing" or "fast". Every response
+    has "ok", and "error" instead of a result when the request failed.
+
+    The work runs in a process pool whose workers keep the generator tables,
+    the prepared G2 point, the decompression cache and a blinding pool warm
+    for their whole lifetime. At most max_pending requests are in flight
+    across all connections. A connection whose request is waiting for one of
+    those slots is not read any further, so backpressure reaches the clients
+    through the socket, while idle connections hold no slot at all.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        max_pending (int): The most requests in flight at once.
+    """
+
+    def __init__(self, workers: int | None = None, max_pending: int = 64) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._slots: asyncio.Semaphore | None = None
+        self._executor = ProcessPoolExecutor(
+            self.workers, initializer=_initialize, initargs=(get_backend().name,)
+        )
+
+    async def start(
+        self, path: str | None = None, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.Server:
+        """
+        Warms every worker and starts listening.
+
+        Args:
+            path (str, optional): A Unix socket path. Listens on TCP if None.
+            host (str, optional): The TCP host. Defaults to localhost.
+            port (int, optional): The TCP port, 0 picks a free one.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        # the slots belong to the event loop the server runs on
+        self._slots = asyncio.Semaphore(self.max_pending)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _ping) for _ in range(self.workers))
+        )
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self.handle, path, limit=request_limit
+            )
+        return await asyncio.start_server(self.handle, host, port, limit=request_limit)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                response = await self.dispatch(line)
+                async with lock:
+                    writer.write(
+                        json.dumps(response, separators=(",", ":")).encode() + b"\n"
+                    )
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                self._slots.release()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    line = b""
+                if not line:
+                    break
+                # an idle connection holds no slot, a request waits for one and
+                # its connection is not read any further until it gets it
+                await self._slots.acquire()
+                task = asyncio.create_task(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def dispatch(self, line: bytes) -> dict:
+        """
+        Runs one request line in the pool and builds its response.
+
+        Args:
+            line (bytes): The JSON request.
+
+        Returns:
+            dict: The JSON response.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            op = request["op"]
+            if op == "prove":
+                call = (_prove, request["value"], request["lower"], request["upper"])
+                key = "proof"
+            elif op == "verify":
+                call = (
+                    _verify,
+                    request["proof"],
+                    request["lower"],
+                    request["upper"],
+                    request.get("mode", "pairing"),
+                )
+                key = "valid"
+            elif op == "batch-verify":
+                jobs = [
+                    (item["proof"], item["lower"], item["upper"])
+                    for item in request["proofs"]
+                ]
+                call = (_verify_batch, jobs, request.get("mode", "pairing"))
+                key = "valid"
+            else:
+                raise ValueError(f"Unknown operation: {op}")
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, *call)
+        except Exception as error:
+            return {"id": request_id, "ok": False, "error": str(error) or repr(error)}
+        return {"id": request_id, "ok": True, key: result}
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+
+def _initialize(backend: str) -> None:
+    # runs once in every worker process and keeps the state for its lifetime
+    global _pool
+    set_backend(backend)
+    generator_g.table()
+    generator_h.table()
+    prepared_q.lines()
+    _pool = BlindingPool()
+
+
+def _ping() -> None:
+    pass
+
+
+def _prove(value: int, lower: int, upper: int) -> dict:
+    return Range(value, lower, upper, pool=_pool).generate_proof()
+
+
+def _verify(proof: dict, lower: int, upper: int, mode: str) -> bool:
+    return Range.verify_proof(proof, lower, upper, mode)
+
+
+def _verify_batch(jobs: list[tuple[dict, int, int]], mode: str) -> list[bool]:
+    return Range.verify_batch(jobs, mode)
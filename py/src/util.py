@@ -17,6 +17,20 @@ def hexify(n: int) -> str:
     return hex_n
 
 
+def int_to_bytes(n: int) -> bytes:
+    """
+    Convert a non-negative integer to its shortest big-endian bytes, the
+    bytes that hexify spells out.
+
+    Args:
+        n (int): The integer to convert.
+
+    Returns:
+        bytes: The big-endian bytes of the integer, at least one byte long.
+    """
+    return n.to_bytes(max(1, (n.bit_length() + 7) // 8), "big")
+
+
 def hex_encode(msg: str) -> str:
     """
     Encode a string into hexadecimal format.
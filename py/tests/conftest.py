@@ -0,0 +1,15 @@
+import pytest
+from src.backends import available_backends, get_backend, set_backend
+
+
+@pytest.fixture
+def restore_backend():
+    # tests may switch backends, the next test starts from the same one
+    active = get_backend().name
+    yield
+    set_backend(active)
+
+
+@pytest.fixture(params=available_backends())
+def each_backend(request, restore_backend):
+    return set_backend(request.param)
@@ -0,0 +1,163 @@
+import subprocess
+import sys
+
+import pytest
+import src.backends as backends
+from src.backends import (
+    BACKEND_ENV,
+    Backend,
+    available_backends,
+    default_backend,
+    optimized,
+    reference,
+    register_backend,
+    set_backend,
+)
+from src.backends.common import wnaf
+from src.bls12_381 import G1Point, G2Point, compress_many, field_order, msm, rng
+
+
+@pytest.mark.parametrize("group", ["g1", "g2"])
+def test_optimized_matches_reference(group):
+    fast = getattr(optimized.backend, group)
+    slow = getattr(reference.backend, group)
+    for _ in range(4):
+        a, b = rng(), rng()
+        p, q = fast.multiply(fast.generator, a), fast.multiply(fast.generator, b)
+        rp, rq = slow.multiply(slow.generator, a), slow.multiply(slow.generator, b)
+        assert fast.encode(p) == slow.encode(rp)
+        assert fast.encode(fast.add(p, q)) == slow.encode(slow.add(rp, rq))
+        assert fast.encode(fast.double(p)) == slow.encode(slow.double(rp))
+        assert fast.encode(fast.neg(p)) == slow.encode(slow.neg(rp))
+        assert fast.is_inf(fast.add(p, fast.neg(p)))
+        assert fast.eq(fast.add(p, p), fast.double(p))
+        assert fast.affine(p) == slow.affine(rp)
+        assert fast.eq(fast.from_reference(rp), p)
+        assert slow.eq(fast.to_reference(p), rp)
+        assert fast.encode(fast.decode(slow.encode(rp))) == slow.encode(rp)
+    assert fast.encode(fast.zero) == slow.encode(slow.zero)
+    assert fast.encode_many([fast.zero, p]) == slow.encode_many([slow.zero, rp])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        bytes(48),
+        bytes.fromhex("c0" + "00" * 46 + "01"),
+        bytes.fromhex("e0" + "00" * 47),
+        bytes.fromhex("9a" + "ff" * 47),
+        bytes.fromhex("80" + "00" * 46 + "07"),
+        # a valid point padded or truncated to the wrong length
+        bytes(48) + G1Point.generator().to_bytes(),
+        G1Point.generator().to_bytes()[:47],
+    ],
+)
+def test_g1_decode_errors_match_reference(data):
+    with pytest.raises(ValueError) as slow:
+        reference.backend.g1.decode(data)
+    with pytest.raises(ValueError) as fast:
+        optimized.backend.g1.decode(data)
+    assert str(fast.value) == str(slow.value)
+
+
+def test_g2_decode_errors_match_reference():
+    padded = bytes(48) + G2Point.generator().to_bytes()
+    for data in [bytes(96), bytes.fromhex("80" + "00" * 94 + "06"), padded]:
+        with pytest.raises(ValueError) as slow:
+            reference.backend.g2.decode(data)
+        with pytest.raises(ValueError) as fast:
+            optimized.backend.g2.decode(data)
+        assert str(fast.value) == str(slow.value)
+
+
+def test_set_backend(restore_backend):
+    assert set_backend("py_ecc") is reference.backend
+    assert G1Point.generator().ops is reference.backend.g1
+    assert set_backend("python") is optimized.backend
+    assert G2Point.generator().ops is optimized.backend.g2
+    with pytest.raises(ValueError):
+        set_backend("nope")
+
+
+def test_points_from_both_backends_mix(restore_backend):
+    scalars = [rng() for _ in range(3)]
+    set_backend("py_ecc")
+    slow = [G1Point.generator() * s for s in scalars]
+    slow_total = msm(slow, scalars)
+    set_backend("python")
+    fast = [G1Point.generator() * s for s in scalars]
+    assert fast == slow
+    assert slow[0] + fast[1] == fast[0] + slow[1]
+    assert msm(fast[:1] + slow[1:], scalars) == slow_total
+    assert compress_many(fast) == compress_many(slow)
+    total = sum(s * s for s in scalars) % field_order
+    assert slow_total.to_bytes() == (G1Point.generator() * total).to_bytes()
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV, "py_ecc")
+    assert default_backend() == "py_ecc"
+    monkeypatch.delenv(BACKEND_ENV)
+    # accelerated backends are opt-in even when installed
+    assert default_backend() == "python"
+
+
+def test_only_the_selected_backend_is_imported(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV, "py_ecc")
+    code = "import sys, src.bls12_381; print('src.backends.optimized' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_register_backend(restore_backend, monkeypatch):
+    monkeypatch.setattr(backends, "_registry", {})
+    register_backend(Backend("custom", reference.backend.g1, reference.backend.g2))
+    assert "custom" in available_backends()
+    set_backend("custom")
+    assert G1Point.generator() * 3 + G1Point.generator() == G1Point.generator() * 4
+
+
+def test_glv_endomorphism_is_lambda():
+    g1 = optimized.backend.g1
+    p = g1.multiply(g1.generator, rng())
+    assert g1.eq(g1.endomorphism(p), g1.multiply(p, optimized.LAMBDA))
+    for scalar in [rng(), field_order - 1, optimized.LAMBDA + 5]:
+        k1, k2 = optimized.glv_decompose(scalar)
+        assert (k1 + k2 * optimized.LAMBDA) % field_order == scalar
+        assert max(k1.bit_length(), k2.bit_length()) <= 129
+
+
+def test_wnaf():
+    for scalar in [0, 1, 31, rng()]:
+        digits = wnaf(scalar, 5)
+        assert sum(d << i for i, d in enumerate(digits)) == scalar
+        assert all(d == 0 or (d % 2 and abs(d) < 16) for d in digits)
+
+
+@pytest.mark.parametrize(
+    "scalar",
+    [0, 1, 2, 15, 2**128, optimized.LAMBDA, optimized.LAMBDA + 1, field_order - 1],
+)
+def test_glv_multiply_edge_scalars(scalar):
+    fast = optimized.backend.g1
+    slow = reference.backend.g1
+    expected = slow.encode(slow.multiply(slow.generator, scalar))
+    assert fast.encode(fast.multiply(fast.generator, scalar)) == expected
+
+
+@pytest.mark.parametrize(
+    "group, outside",
+    [("g1", "80" + "00" * 46 + "04"), ("g2", "80" + "00" * 94 + "02")],
+)
+def test_subgroup_checks_match_reference(group, outside):
+    fast = getattr(optimized.backend, group)
+    slow = getattr(reference.backend, group)
+    data = bytes.fromhex(outside)
+    assert not fast.in_subgroup(fast.decode(data))
+    assert not slow.in_subgroup(slow.decode(data))
+    inside = fast.multiply(fast.generator, rng())
+    assert fast.in_subgroup(inside)
+    assert fast.in_subgroup(fast.zero)
+    assert slow.in_subgroup(fast.to_reference(inside))
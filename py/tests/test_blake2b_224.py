@@ -1,4 +1,4 @@
-from src.blake2b_224 import fiat_shamir_heuristic, generate
+from src.blake2b_224 import fiat_shamir_digest, fiat_shamir_heuristic, generate
 
 
 def test_empty_string_hash():
@@ -24,3 +24,11 @@ def test_real_fiat_shamir_heuristic():
         "a2cbc5c3c72a7bc9047971345df392a67279d2f32082891976d913c699885c3ff9a90a8ea942bef4729cf93f526521e4",
     )
     assert fsh == "c4f2937e8317aee04a17b6ea65b2e3706aabd75dd2ebce5e6c8744ed"
+
+
+def test_fiat_shamir_digest_matches_the_hex_heuristic():
+    g = bytes.fromhex(
+        "86f0c64bd433568dd92751f0bee97feaaeee6f3c2144b210be68d2bc85253b1994703caf7f8361ccf246fef52c0ad859"
+    )
+    fsh = fiat_shamir_digest(g, g, g)
+    assert fsh == bytes.fromhex(fiat_shamir_heuristic(g.hex(), g.hex(), g.hex()))
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+from src.blinding_pool import BlindingPool
+from src.bls12_381 import G1Point
+from src.range import Range
+
+
+def test_pairs_are_blinding_points_handed_out_once():
+    pool = BlindingPool(size=8, background=False)
+    pool.fill()
+    assert len(pool) == 8
+    pairs = [pool.take() for _ in range(8)]
+    assert len(pool) == 0
+    assert len({r for r, _ in pairs}) == 8
+    for r, r_g in pairs:
+        assert r_g == G1Point.generator() * r
+    # an empty pool computes the pair itself
+    r, r_g = pool.take()
+    assert r_g == G1Point.generator() * r
+    assert pool.misses == 1
+    with pytest.raises(ValueError):
+        BlindingPool(size=0)
+
+
+def test_background_refill():
+    with BlindingPool(size=16, refill_at=4, batch=4) as pool:
+        deadline = time.monotonic() + 30
+        while len(pool) < 16 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(pool) == 16
+        for _ in range(12):
+            pool.take()
+        while len(pool) < 16 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(pool) == 16
+    assert not pool._thread.is_alive()
+
+
+def test_range_proofs_from_a_pool():
+    pool = BlindingPool(size=32, background=False)
+    pool.fill()
+    for lower, upper, value in [(0, 100, 42), (0, pow(2, 64) - 1, pow(2, 63))]:
+        proof = Range(value, lower, upper, pool=pool).create_proof()
+        assert Range.verify_proof(proof, lower, upper)
+        assert not Range.verify_proof(proof, lower + 1, upper)
+    assert pool.misses == 0
+    assert len(pool) == 32 - 2 * 7
+
+
+def test_a_pool_kept_full_waits_while_idle():
+    with BlindingPool(size=4, refill_at=4, batch=4) as pool:
+        deadline = time.monotonic() + 30
+        while len(pool) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        start = time.process_time()
+        time.sleep(0.5)
+        assert time.process_time() - start < 0.2
+        pool.take()
+        while len(pool) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(pool) == 4
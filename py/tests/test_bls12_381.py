@@ -1,5 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import src.bls12_381 as bls12_381
 from src.bls12_381 import (
+    DecompressionCache,
+    FixedBase,
+    G1Point,
+    G2Point,
+    PreparedG2,
     combine,
+    compress_many,
+    double_scalar_mul,
+    field_order,
     compress,
     g1_identity,
     g1_point,
@@ -7,12 +19,18 @@ from src.bls12_381 import (
     g2_point,
     gt_identity,
     invert,
+    msm,
     pair,
+    pairing_product_is_one,
     scale,
     uncompress,
+    uncompress_many,
     rng,
 )
 
+# every vector here is checked against every backend
+pytestmark = pytest.mark.usefixtures("each_backend")
+
 
 def test_rng():
     r = rng()
@@ -121,3 +139,250 @@ def test_exponent_identity():
         * pair(invert(v1g2), scale(u1g1, 42))
         == gt_identity
     )
+
+
+def test_g1_point_round_trip():
+    p = G1Point.generator() * 123456789
+    assert G1Point.from_hex(p.hex()) == p
+    assert p.hex() == g1_point(123456789)
+
+
+def test_g2_point_round_trip():
+    p = G2Point.generator() * 123456789
+    assert G2Point.from_bytes(p.to_bytes()) == p
+    assert p.hex() == g2_point(123456789)
+
+
+def test_point_chain_matches_hex_helpers():
+    g = G1Point.generator()
+    p = (g * 42 + g * 58 - g * 7) * 3
+    expected = scale(
+        combine(combine(g1_point(42), g1_point(58)), invert(g1_point(7))), 3
+    )
+    assert p.hex() == expected
+
+
+def test_point_identity():
+    g = G1Point.generator()
+    assert (g - g).is_identity()
+    assert (g - g) == G1Point.identity()
+    assert G1Point.identity().hex() == g1_identity
+    assert G2Point.identity().hex() == g2_identity
+
+
+def test_point_negative_scalar():
+    g = G1Point.generator()
+    assert g * -5 == -(g * 5)
+
+
+def test_point_hash_is_projective_invariant():
+    g = G1Point.generator()
+    assert hash(g + g) == hash(g * 2)
+    assert len({g + g, g * 2, G1Point.from_hex(g1_point(2))}) == 1
+
+
+def test_fixed_base_matches_scale():
+    fb = FixedBase(G1Point.generator() * 3, window=4)
+    for scalar in [0, 1, 15, 16, 123456789, field_order - 1, rng()]:
+        assert fb.multiply(scalar).hex() == scale(g1_point(3), scalar)
+
+
+def test_fixed_base_reduces_scalar():
+    fb = FixedBase(G1Point.generator(), window=4)
+    assert fb.multiply(field_order + 5) == fb.multiply(5)
+    assert fb.multiply(-5) == -fb.multiply(5)
+
+
+def test_fixed_base_g2():
+    fb = FixedBase(G2Point.generator(), window=4)
+    assert fb.multiply(123456789).hex() == g2_point(123456789)
+
+
+def test_double_scalar_mul_free_points():
+    p = G1Point.generator() * 7
+    q = G1Point.generator() * 11
+    a, b = rng(), rng()
+    assert double_scalar_mul(a, p, b, q) == G1Point.generator() * (7 * a + 11 * b)
+
+
+def test_double_scalar_mul_fixed_and_free():
+    g = FixedBase(G1Point.generator(), window=4)
+    q = G1Point.generator() * 11
+    a, b = rng(), 2**223 + 5
+    assert double_scalar_mul(a, g, b, -q) == G1Point.generator() * (a - 11 * b)
+    assert double_scalar_mul(a, g, b, g) == G1Point.generator() * (a + b)
+
+
+def test_double_scalar_mul_zero_scalars():
+    p = G1Point.generator()
+    assert double_scalar_mul(0, p, 0, p).is_identity()
+    assert double_scalar_mul(0, p, 3, p) == p * 3
+
+
+def test_double_scalar_mul_g2():
+    p = G2Point.generator()
+    assert double_scalar_mul(2, p, 3, p * 2).hex() == g2_point(8)
+
+
+def _naive_msm(points, scalars):
+    total = points[0] * 0
+    for point, scalar in zip(points, scalars):
+        total = total + point * scalar
+    return total
+
+
+def test_msm_straus():
+    points = [G1Point.generator() * (i + 1) for i in range(5)]
+    scalars = [rng() for _ in points]
+    assert msm(points, scalars) == _naive_msm(points, scalars)
+
+
+def test_msm_pippenger(monkeypatch):
+    monkeypatch.setattr(bls12_381, "msm_crossover", 0)
+    points = [G1Point.generator() * (i + 1) for i in range(20)]
+    scalars = [rng() for _ in points] + [0, field_order]
+    points += [G1Point.generator(), G1Point.identity()]
+    assert msm(points, scalars) == _naive_msm(points, scalars)
+
+
+def test_msm_with_fixed_base():
+    g = FixedBase(G1Point.generator(), window=4)
+    p = G1Point.generator() * 5
+    assert msm([g, p, g], [3, 4, 2]) == G1Point.generator() * 25
+
+
+def test_msm_bad_input():
+    with pytest.raises(ValueError):
+        msm([], [])
+    with pytest.raises(ValueError):
+        msm([G1Point.generator()], [1, 2])
+
+
+def test_pairing_product_is_one():
+    # e(7V, 3U) * e(-V, 21U) = 1
+    u = G1Point.generator()
+    v = G2Point.generator()
+    assert pairing_product_is_one([(v * 7, u * 3), (-v, u * 21)])
+    assert not pairing_product_is_one([(v * 7, u * 3), (-v, u * 20)])
+
+
+def test_pairing_product_with_hex_and_identity():
+    assert pairing_product_is_one(
+        [(g2_point(2), g1_point(5)), (invert(g2_point(1)), g1_point(10))]
+    )
+    assert pairing_product_is_one([(g2_point(1), g1_identity)])
+
+
+def test_prepared_g2_matches_miller_loop():
+    from py_ecc.optimized_bls12_381.optimized_pairing import miller_loop
+
+    q = G2Point.generator() * 5
+    p = G1Point.generator() * 21
+    expected = miller_loop(q.reference(), p.reference(), final_exponentiate=False)
+    assert bls12_381._prepared_miller_loop([(PreparedG2(q), p)]) == expected
+
+
+def test_pairing_product_with_prepared_g2():
+    u = G1Point.generator()
+    v = PreparedG2(G2Point.generator())
+    assert pairing_product_is_one([(v, u * 6), (v, -(u * 6))])
+    assert pairing_product_is_one([(v, u * 6), (G2Point.generator() * 3, -(u * 2))])
+    assert not pairing_product_is_one([(v, u * 6), (v, -(u * 5))])
+
+
+def test_decompression_cache_hits_and_eviction():
+    cache = DecompressionCache(maxsize=2)
+    blobs = [bytes.fromhex(g1_point(i)) for i in [1, 2, 3]]
+    assert G1Point(cache.lookup(G1Point, blobs[0])) == G1Point.generator()
+    cache.lookup(G1Point, blobs[0])
+    cache.lookup(G1Point, blobs[1])
+    cache.lookup(G1Point, blobs[2])
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 3, 2, 2)
+    assert info.hit_rate == 0.25
+    # the first blob was the least recently used one
+    cache.lookup(G1Point, blobs[0])
+    assert cache.info().misses == 4
+
+
+def test_decompression_cache_disabled():
+    cache = DecompressionCache(maxsize=4)
+    g2 = bytes.fromhex(g2_point(1))
+    cache.lookup(G2Point, g2)
+    cache.resize(0)
+    cache.lookup(G2Point, g2)
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0)
+
+
+def test_decompression_cache_threads():
+    cache = DecompressionCache(maxsize=8)
+    blobs = [bytes.fromhex(g1_point(i % 4 + 1)) for i in range(64)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        points = list(pool.map(lambda b: cache.lookup(G1Point, b), blobs))
+    assert all(G1Point(pt).to_bytes() == b for pt, b in zip(points, blobs))
+    info = cache.info()
+    assert info.hits + info.misses == 64
+    assert info.currsize == 4
+
+
+def test_points_decode_through_the_cache():
+    bls12_381.decompression_cache.clear()
+    G1Point.from_hex(g1_point(5))
+    G1Point.from_hex(g1_point(5))
+    assert bls12_381.decompression_cache.info().hits == 1
+
+
+def test_compress_many_matches_compress():
+    g1 = [G1Point.generator() * rng() + G1Point.generator() for _ in range(10)]
+    g2 = [G2Point.generator() * 5 + G2Point.generator() * 7]
+    points = g1 + [G1Point.identity()] + g2 + [G2Point.identity(), g1[0]]
+    expected = [compress(point.reference()) for point in points]
+    blobs = compress_many(points)
+    assert [blob.hex() for blob in blobs] == expected
+    assert compress_many([]) == []
+
+
+def test_uncompress_many_round_trip():
+    blobs = [bytes.fromhex(g1_point(i)) for i in range(4)] + [
+        bytes.fromhex(g2_point(3))
+    ]
+    points = uncompress_many(blobs)
+    assert [type(point) for point in points] == [G1Point] * 4 + [G2Point]
+    assert compress_many(points) == blobs
+
+
+# on the curve, but outside of the prime-order subgroups
+G1_OUTSIDE = "80" + "00" * 46 + "04"
+G2_OUTSIDE = "80" + "00" * 94 + "02"
+
+
+def test_validation_levels():
+    for group, outside in [(G1Point, G1_OUTSIDE), (G2Point, G2_OUTSIDE)]:
+        with pytest.raises(ValueError, match="subgroup"):
+            group.from_hex(outside)
+        point = group.from_hex(outside, bls12_381.ON_CURVE_ONLY)
+        assert not point.in_subgroup()
+        assert group.from_hex(outside, bls12_381.TRUSTED) == point
+        assert (group.generator() * rng()).in_subgroup()
+    with pytest.raises(ValueError, match="Unknown validation level"):
+        G1Point.from_hex(g1_point(1), "some")
+    with pytest.raises(ValueError, match="not on G1"):
+        G1Point.from_hex("80" + "00" * 46 + "07", bls12_381.ON_CURVE_ONLY)
+
+
+def test_full_validation_runs_once_per_point(monkeypatch):
+    ops = G1Point.generator().ops
+    calls = []
+    monkeypatch.setattr(
+        ops, "in_subgroup", lambda pt: calls.append(pt) or True, raising=False
+    )
+    blob = bytes.fromhex(g1_point(rng()))
+    G1Point.from_bytes(blob, bls12_381.ON_CURVE_ONLY)
+    assert calls == []
+    G1Point.from_bytes(blob)
+    G1Point.from_bytes(blob)
+    uncompress_many([blob, blob])
+    assert len(calls) == 1
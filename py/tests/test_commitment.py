@@ -1,5 +1,7 @@
-from src.bls12_381 import field_order, g1_identity, g1_point, scale
-from src.commitment import Commitment
+import pytest
+from src import commitment
+from src.bls12_381 import field_order, g1_identity, g1_point, rng, scale
+from src.commitment import Commitment, generator_g, generator_h
 
 
 def test_null_commitment():
@@ -91,3 +93,48 @@ def test_knowledge_of_r():
     r = 44203
     c0 = Commitment(v=v, r=r)
     assert c0.prove_knowledge_of_r(v)
+
+
+def test_generators():
+    assert generator_g.point.hex() == g1_point(1)
+    assert generator_h.point.hex() == g1_point(2)
+    assert generator_h.multiply(44203).hex() == scale(g1_point(2), 44203)
+
+
+def test_arithmetic_keeps_the_opening_consistent():
+    c0 = Commitment(v=123456789)
+    c1 = Commitment(v=987654321)
+    for combined in [c0 + c1, c0 - c1, (c0 + c1) - c1 + c0]:
+        assert combined == Commitment(combined.v, combined.r)
+    assert (c0 - c0).c.value == g1_identity
+
+
+def test_commit_many_matches_single_commitments():
+    values = [0, 1, 44203, field_order - 1]
+    randomness = [5, 0, 12345, 987654321]
+    batch = Commitment.commit_many(values, randomness)
+    assert len(batch) == 4
+    assert len(batch.commitments.to_bytes()) == 4 * 48
+    for c, v, r in zip(batch, values, randomness):
+        assert c == Commitment(v, r)
+    random_batch = Commitment.commit_many(values)
+    assert random_batch[2] == Commitment(44203, random_batch.randomness[2])
+    with pytest.raises(ValueError):
+        Commitment.commit_many(values, randomness[:3])
+
+
+def test_commit_stream_and_workers_agree(monkeypatch):
+    monkeypatch.setattr(commitment, "parallel_threshold", 0)
+    values = list(range(10))
+    randomness = [rng() for _ in values]
+    expected = Commitment.commit_many(values, randomness)
+    assert Commitment.commit_many(values, randomness, workers=2) == expected
+    for workers in [None, 2]:
+        chunks = list(
+            Commitment.commit_stream(
+                iter(values), iter(randomness), chunk_size=3, workers=workers
+            )
+        )
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        joined = b"".join(chunk.commitments.to_bytes() for chunk in chunks)
+        assert joined == expected.commitments.to_bytes()
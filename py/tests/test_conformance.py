@@ -0,0 +1,134 @@
+import pytest
+from src.backends import available_backends, set_backend
+from src.bls12_381 import G1Point, G2Point, pairing_product_is_one
+from src.range import Range
+
+# the constants in lib/constants.ak
+G = "97f1d3a73197d7942695638c4fa9ac0fc3688c4f9774b905a14e3a3f171bac586c55e83ff97a1aeffb3af00adb22c6bb"
+H = "a572cbea904d67468808c8eb50a9450c9721db309128012543902d0ac358a62ae28f75bb8f1c7c42c39a8c5529bf0f4e"
+Q = "93e02b6052719f607dacd3a088274f65596bd0d09920b61ab5da61bbdc7f5049334cf11213945d57e5ac7d055d042b7e024aa2b2f08f0a91260805272dc51051c6e47ad4fa403b02b4510b647ae3d1770bac0326a805bbefd48056c8c121bdb8"
+
+# simple_range_proof in lib/range.ak
+SIMPLE_RANGE_PROOF = {
+    "Y": "84ea78e4c3a283c5e8c178f1ff9e384abb11ff93888b4bc8eb4297131dceec0db2c528015303323309137994e4550bbf",
+    "D": "8e905fa2a944570cdd5933334394c0b937582169d555c90ad158b63304d3d89c96c822bb489dc82d7eca01cf7daaf92f",
+    "R": "8109eba987d1692ba22195d87507d4405a8598701844987c7bdcd634b069aabd4b50663bd0f4d9411169ee65d1950b23",
+    "A": "8d8a58fed45ab8b1e48deb07561070c7eef4e712fbfeeb1d82d041f1c2dfc4a6e52feeea10432bcd4e60017f45102e9a",
+    "B": "81d43f697a75ad20a807c9b7446846dbc7f4f7cac6ecb212632eaff2c55e94cd42c906300d663375903e1e1d5efbfbe7",
+    "W": "b145b1b4465e85cd79af4f957449b2e2b7266716decdcc92f3613425d29f1d18cb3e93ba3b3cec801645f781ab794bdc",
+    "L": "b72f1c1b1a9726c20579963fa60bb699701d71f4c0a854748e8b630457a9948c33092d41b9a2e70091ddf7dd580b2edc",
+}
+
+# the ZKInterval tests in lib/zk_interval.ak as (proof, lower, upper)
+ZK_INTERVAL_PROOFS = {
+    "a_zk_interval_proof": (
+        {
+            "Y": "b928f3beb93519eecf0145da903b40a4c97dca00b21f12ac0df3be9116ef2ef27b2ae6bcd4c5bc2d54ef5a70627efcb7",
+            "D": "ad84464b3966ec5bede84aa487facfca7823af383715078da03b387cc2f5d5597cdd7d025aa07db00a38b953bdeb6e3f",
+            "R": "89ece308f9d1f0131765212deca99697b112d61f9be9a5f1f3780a51335b3ff981747a0b2ca2179b96d2c0c9024e5224",
+            "A": "9780e853f8ce7eda772c6691d25e220ca1d2ab0db51a7824b700620f7ac94c06639e91c98bb6abd78128f0ec845df8ef",
+            "B": "97f1d3a73197d7942695638c4fa9ac0fc3688c4f9774b905a14e3a3f171bac586c55e83ff97a1aeffb3af00adb22c6bb",
+            "W": "8d9e19b3f4c7c233a6112e5397309f9812a4f61f754f11dd3dcb8b07d55a7b1dfea65f19a1488a14fef9a41495083582",
+            "L": "89ece308f9d1f0131765212deca99697b112d61f9be9a5f1f3780a51335b3ff981747a0b2ca2179b96d2c0c9024e5224",
+            "Za": "45e8b989d0f75db379c4fe6c44e985405658805fb2133ad9fe92c682",
+            "ac": "8f5dd46d79e059c0a234b0e91f16b46aabf97ce030e99f997a2ab8da5b283474485d167e1060aabecb5e3c44aaba44a2",
+            "Zb": "45e8b989d0f75db379c4fe6c44e985405658805fb2133ad9fe92c682",
+            "bc": "8f5dd46d79e059c0a234b0e91f16b46aabf97ce030e99f997a2ab8da5b283474485d167e1060aabecb5e3c44aaba44a2",
+        },
+        0,
+        10,
+    ),
+    "real_zk_interval_proof1": (
+        {
+            "Y": "80a8871fdc79aee14b24be6493344c74d71a6e33a18903ed55e032ae510aa0587919b101005783809fdaea0b6dbbe223",
+            "D": "8ffb4315e16fa8bc295e27187a706c8431adacbbcfd5dbb1b0719b4e995031006f28ac67259d4a042a027e9f26cc7316",
+            "R": "950b1b8c1f76a834dff18fdfb7699a05b5927d4663d7e90be6fd88488ee28a83ae401a06d2743c88a7ea92cafef31180",
+            "A": "90aade2b7b38e7d99b549d520e81251501397232104dba6384a5633242e5ca882e31088d563185c0ae0ae699be38ce08",
+            "B": "81fa8b6f0861dc60a0edd8e9542472ca07ff1f122b6ef30344d3448c74d9202a2e331b83910ac624874dc14a6a88abef",
+            "W": "ad034e8f2ff079510932486e05129fb3c04e68a17f44f86115403cebb9917001314e63a1c608c605ec2011ddd73ee4fc",
+            "L": "8d492cace882a1d8e92b6a4f4c9f2f629d0d830f5e42fa9d7502c556c0593249bf27630d96d6ae67feb50cb98c16a374",
+            "Za": "02a9843cb426bbfd93b9b7280b2dbd49385970d535f3084ed4280ccbb06070e4",
+            "ac": "aae176bf3c9480aa106a359d8b6b90c2e3967128b9c6dee5c4ed61132af0aaa126ce210cd6875818b29d6534f789c84a",
+            "Zb": "234c808f2848f21ada85a89f8c450b90f31ec14843c7a713685e5ac6c85a5c93",
+            "bc": "9172117683335c9d4b2f695abfb906df2eb315c42d55fd401ea984cc97bf5a8cfbb706f98bb43ccc23ba66b43d1949d9",
+        },
+        10,
+        50,
+    ),
+    "real_zk_interval_proof2": (
+        {
+            "Y": "abfe23767dbeb62d76ee24c52467cb19b2e6355be9e2718f8737fac68a87380f27f8533357ec633a28353ec22a674cf8",
+            "D": "98ec59154736f7876c182e59dc4c4a72c522b9c42dda76efc3890f9768c9b92a33de38d106a8a6bafff9ceeb6310ac32",
+            "R": "8b5a26346a6c55d55469b24535b7485936fac77e892b5058c1386b420bf1211db9a29f285bb882bccc1173c8f662ca5e",
+            "A": "9337c578adb0e080ab31139ffd1f5b4629a02b884cfc472c4ed78fe34b8720d1ebc6043b6e8030bdd31a61ca5c7b3891",
+            "B": "8bb21c2ffb1046f01e63b0c699863bb377053ccf5aca6644635ee54c214f741676a6926fae8fbdc859a2370211aaa3dd",
+            "W": "9746326664b6d0c259be6b38d2d58e0d806ef554ab9f2babb51ecff91efae63cee22ab28acf7d3ecc8a8c246d0df38f8",
+            "L": "b96f36cf0acaf85c021e6823511839633deaf1cea6898631289943f53cf6cdcd97806651d33b192634d90c6982389409",
+            "Za": "09035341e6535331c3dea3db33a3c5d28b592c9c232574f333399e41147c0267",
+            "ac": "9119e038df86936a0b3adc24eed7def148c4d9c08a7c4c84006f7f69d94dfeae623241a86add0960059c9c6dc763a011",
+            "Zb": "70c6b4eccaab139bc2a336ff81695c42567f699468b33e72e19aa52f729f6162",
+            "bc": "ae620e5065a9eea1e68e5703954b623e14cbbab43e85d9b676a3a25f104ec9c6f857fa414f87857775fe3c1003e725b7",
+        },
+        0,
+        100,
+    ),
+    "range_proof_64_bit": (
+        {
+            "Y": "91e788a8d637867e6d5aa08f681951e0747c8d366e94516cfbea2eac9d6a5599abedb0cb5635c734e8e73fb441ddec22",
+            "D": "ac0df002362bbce742e3c5f0dc4089836f4bcf330d958e3e8eb03d9a0007deaf40848f04caeaad9980bd109751b39ad8",
+            "R": "96656e6c6b2c6588f90e785501d05fcf2887fa47d0651cb4be9a21e5e5c2a9d3ca0c74172a1819255727ff35e9a74b06",
+            "A": "86ec2652196645493b5dcfc8b39395da79f7772cd10679febe93e4647c7ca15c3c04dde89801a30dae55f2212f1eb00c",
+            "B": "ab530039af16ea0d8429aa3de557a840f86918e1c9398a2b33e8bc35d64cdac246d59fa4edd1865c0fb10cbd43f79e27",
+            "W": "a3803f915947c40e28552e208135a00ff944784232004576e3a62799bb032e601f9d50d4815e826d22223f83d0d2bf17",
+            "L": "ad7c70488cb25379aaa55bb198ab4db882ecd7653a494d3018e53514fcfded06435b30257b859cc7025e90771f8e4c5d",
+            "Za": "059d2dd4747cd362b920c6ede86f6fa85bf7f9c1332553029711aa009363deea",
+            "ac": "b68e696a3aad260b451b3c9065d6433a91db539408303da23728dafb1af6ebf41c3ffacff53006dcb260e245e99bf9d6",
+            "Zb": "2f0a8a5ebe71a9b06542e5e11dfdd27cd18b394b097941ef6298f7c5a2765dee",
+            "bc": "8e062b0795a0e4e7c071565016e084f1495db3e6bdbaec5867446e5847fe58d8243b059c8e8a8aa0ff5611b126614252",
+        },
+        0,
+        18446744073709551616,
+    ),
+}
+
+
+# every vector here is checked against every backend
+pytestmark = pytest.mark.usefixtures("each_backend")
+
+
+def test_constants():
+    g = G1Point.generator()
+    assert g.hex() == G
+    assert (g + g).hex() == H
+    assert (g * 2).hex() == H
+    assert G2Point.generator().hex() == Q
+    assert G2Point.from_hex(Q) * 1 == G2Point.generator()
+
+
+def test_simple_range_proof():
+    points = {key: G1Point.from_hex(value) for key, value in SIMPLE_RANGE_PROOF.items()}
+    left = points["Y"] + points["D"] + points["R"]
+    right = points["A"] + points["B"] + points["W"] + points["L"]
+    q = G2Point.from_hex(Q)
+    assert pairing_product_is_one([(q, left), (-q, right)])
+    assert not pairing_product_is_one([(q, left), (-q, right + points["Y"])])
+
+
+@pytest.mark.parametrize("name", list(ZK_INTERVAL_PROOFS))
+def test_zk_interval_proofs(name):
+    proof, lower, upper = ZK_INTERVAL_PROOFS[name]
+    assert Range.verify_proof(proof, lower, upper)
+    assert Range.verify_proof(proof, lower, upper, mode="fast")
+
+
+def test_a_bad_zk_interval_proof():
+    proof, lower, _ = ZK_INTERVAL_PROOFS["a_zk_interval_proof"]
+    # this is not the real upper bound
+    assert not Range.verify_proof(proof, lower, 100000)
+
+
+def test_generated_proof_verifies_on_every_backend():
+    proof = Range(42, 0, 100).generate_proof()
+    for name in available_backends():
+        set_backend(name)
+        assert Range.verify_proof(proof, 0, 100)
@@ -1,4 +1,5 @@
-from src.bls12_381 import g1_identity, g1_point, invert
+import pytest
+from src.bls12_381 import G1Point, g1_identity, g1_point, g2_point, invert
 from src.element import Element
 
 
@@ -27,3 +28,50 @@ def test_create_element():
     v = "977e26285d0703c75a57759c0a2ea96ecf1bf83aee344cc579defd714c88eb9f5cd50220276e45aa3a85c718396f2565"
     a = Element(v)
     assert a.value == v
+
+
+def test_element_from_point():
+    a = Element.from_point(G1Point.generator() * 42)
+    assert a.value == g1_point(42)
+    assert a == Element(g1_point(42))
+    assert a + Element(g1_point(58)) == Element(g1_point(100))
+
+
+def test_element_is_hashable_and_lazy():
+    a = Element.from_point(G1Point.generator() * 42)
+    b = Element(g1_point(42))
+    # equal whether compared as points or as bytes
+    assert a == b
+    assert a._data is None
+    assert hash(a) == hash(b)
+    assert len({a, b, Element(g1_point(43))}) == 2
+    assert str(a) == g1_point(42)
+    assert repr(b) == f"Element(value='{g1_point(42)}')"
+    assert not hasattr(b, "__dict__")
+
+
+def test_element_bytes_round_trip():
+    a = Element.from_bytes(bytes.fromhex(g1_point(7)))
+    assert a.to_bytes() == bytes.fromhex(g1_point(7))
+    assert a * 2 == Element(g1_point(14))
+    assert ~a + a == Element(g1_identity)
+
+
+def test_element_arithmetic_is_lazy():
+    g = Element(g1_point(1))
+    h = Element(g1_point(2))
+    r, v = 123456789, 42
+    c = r * g + v * h
+    assert c._point is None and c._terms is not None
+    assert (r * g + v * h).value == g1_point(r + 2 * v)
+    assert c == Element(g1_point(r + 2 * v))
+    assert c._terms is None
+    # repeated points and cancellation
+    assert g + g + ~g == g
+    assert (g + h) + ~(h + g) == Element(g1_identity)
+    assert 3 * (g + ~h) == Element(invert(g1_point(3)))
+
+
+def test_element_groups_do_not_mix():
+    with pytest.raises(TypeError):
+        Element(g1_point(1)) + Element(g2_point(1))
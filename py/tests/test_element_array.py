@@ -0,0 +1,81 @@
+import pytest
+from src.bls12_381 import (
+    G1Point,
+    G2Point,
+    decompression_cache,
+    g1_identity,
+    g1_point,
+    g2_point,
+    rng,
+)
+from src.element import Element
+from src.element_array import ElementArray
+
+
+def test_round_trip_and_indexing():
+    values = [g1_point(i) for i in range(1, 6)]
+    array = ElementArray.from_hex(values)
+    assert len(array) == 5
+    assert len(array.to_bytes()) == 5 * 48
+    assert array.hex() == values
+    assert array[1] == Element(values[1])
+    assert array[-1] == Element(values[-1])
+    assert [element.value for element in array] == values
+    assert ElementArray.from_points(array.points()) == array
+    with pytest.raises(IndexError):
+        array[5]
+
+
+def test_slices_share_the_buffer():
+    array = ElementArray.from_hex([g1_point(i) for i in range(1, 6)])
+    view = array[1:4]
+    assert view.hex() == [g1_point(i) for i in range(2, 5)]
+    assert view._data.obj is array._data.obj
+    assert array[::2].hex() == [g1_point(1), g1_point(3), g1_point(5)]
+    assert len(array[4:1]) == 0
+
+
+def test_mutable_buffers_are_copied_before_validation():
+    data = bytearray(bytes.fromhex(g1_point(1) + g1_point(2)))
+    array = ElementArray(data)
+    array.points()
+    data[:48] = bytes.fromhex("80" + "00" * 46 + "04")
+    decompression_cache.clear()
+    assert array.hex() == [g1_point(1), g1_point(2)]
+    assert all(point.in_subgroup() for point in array[:1].points())
+    with pytest.raises(ValueError, match="subgroup"):
+        ElementArray(data).points()
+
+
+def test_arithmetic():
+    a = ElementArray.from_hex([g1_point(i) for i in range(1, 5)])
+    b = ElementArray.from_hex([g1_point(10 * i) for i in range(1, 5)])
+    assert (a + b).hex() == [g1_point(11 * i) for i in range(1, 5)]
+    assert (3 * a).hex() == [g1_point(3 * i) for i in range(1, 5)]
+    assert (-a + a).hex() == [g1_identity] * 4
+    assert a.sum() == Element(g1_point(10))
+    scalars = [rng() for _ in range(4)]
+    expected = sum(s * i for s, i in zip(scalars, range(1, 5)))
+    assert a.inner_product(scalars) == Element(g1_point(expected))
+    with pytest.raises(ValueError):
+        a + a[1:]
+    with pytest.raises(ValueError):
+        a.inner_product([1])
+
+
+def test_g2_arrays():
+    array = ElementArray.from_points([G2Point.generator() * i for i in range(1, 3)])
+    assert array.group is G2Point
+    assert len(array.to_bytes()) == 2 * 96
+    assert array.sum() == Element(g2_point(3))
+    with pytest.raises(TypeError):
+        array + ElementArray.from_points([G1Point.generator()] * 2)
+
+
+def test_untrusted_bytes_are_validated():
+    outside = bytes.fromhex("80" + "00" * 46 + "04")
+    array = ElementArray(bytes.fromhex(g1_point(1)) + outside)
+    with pytest.raises(ValueError, match="subgroup"):
+        array.points()
+    with pytest.raises(ValueError):
+        ElementArray(b"\x00" * 47)
@@ -0,0 +1,67 @@
+import pytest
+from src import prover_pool
+from src.prover_pool import ProverPool
+from src.range import Range
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProverPool(workers=2, chunk_size=3) as pool:
+        yield pool
+
+
+def test_results_in_input_order(pool):
+    jobs = [(value, 0, 100) for value in [0, 42, 100]] + [(7, 5, 10), (9, 0, 2**64 - 1)]
+    results = pool.prove_all(jobs)
+    assert [result.index for result in results] == list(range(5))
+    for result, (value, lower, upper) in zip(results, jobs):
+        assert result.error is None
+        assert Range.verify_proof(result.proof, lower, upper)
+
+
+def test_failing_jobs_are_isolated(pool):
+    jobs = [(42, 0, 100), (101, 0, 100), (1, 0), (3, 5, 10), (50, 0, 100)]
+    results = list(pool.prove(jobs, ordered=False))
+    assert sorted(result.index for result in results) == list(range(5))
+    by_index = {result.index: result for result in results}
+    assert by_index[0].proof is not None and by_index[4].proof is not None
+    assert "Y value" in by_index[1].error
+    assert by_index[2].error is not None
+    assert "W value" in by_index[3].error
+
+
+def test_cancel_stops_the_stream(pool):
+    jobs = ((value, 0, 100) for value in range(10**6))
+    seen = []
+    for result in pool.prove(jobs):
+        seen.append(result)
+        if len(seen) == 4:
+            pool.cancel()
+    # the chunks already finished are still delivered, nothing new is started
+    assert 4 <= len(seen) < 100
+    assert pool.prove_all([(1, 0, 2)])[0].error is None
+
+
+def test_bad_jobs_do_not_take_down_their_chunk():
+    with ProverPool(workers=1, chunk_size=4) as pool:
+        results = pool.prove_all([(42, 0, 100), (1.5, 0, 2), (7, 0, 10), ("3", 0, 10)])
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert Range.verify_proof(results[0].proof, 0, 100)
+    assert Range.verify_proof(results[2].proof, 0, 10)
+    assert "integer" in results[1].error and "integer" in results[3].error
+    assert results[1].proof is None and results[3].proof is None
+
+
+def test_a_failing_interval_falls_back_to_single_jobs(monkeypatch):
+    create_proofs = Range.create_proofs
+
+    def failing(values, lower, upper, pool=None):
+        if 13 in values:
+            raise RuntimeError("unlucky")
+        return create_proofs(values, lower, upper, pool)
+
+    monkeypatch.setattr(Range, "create_proofs", staticmethod(failing))
+    results = prover_pool._prove_chunk(10, [(12, 0, 20), (13, 0, 20), (14, 0, 20)])
+    assert [result.index for result in results] == [10, 11, 12]
+    assert results[0].proof is not None and results[2].proof is not None
+    assert results[1].error == "RuntimeError: unlucky"
@@ -3,9 +3,9 @@ from random import randrange
 
 import pytest
 from src.blake2b_224 import generate
-from src.bls12_381 import field_order, rng
+from src.bls12_381 import G1Point, field_order, g1_identity, g1_point, rng
 from src.commitment import Commitment
-from src.range import Range
+from src.range import Range, RangeProof
 
 
 def test_valid_range():
@@ -245,6 +245,7 @@ def test_proof_generation2():
     print(f"Approximately: {len(combined_string) // 2} Bytes")
     assert Range.verify_proof(proof, lower, upper)
 
+
 def test_proof_generation3():
     lower = 0
     upper = pow(2, 64) - 1
@@ -252,5 +253,143 @@ def test_proof_generation3():
     r = Range(secret_value=age, lower_bound=lower, upper_bound=upper)
     r.generate_proof()
 
+
+def verify_both_modes(proof, lower, upper) -> bool:
+    # the fast mode must always reach the same verdict as the pairing mode
+    pairing_verdict = Range.verify_proof(proof, lower, upper)
+    fast_verdict = Range.verify_proof(proof, lower, upper, mode="fast")
+    assert pairing_verdict == fast_verdict
+    return fast_verdict
+
+
+def test_verify_modes_agree_on_random_proofs():
+    for lower, upper in [(0, 0), (18, 25), (0, pow(2, 64) - 1), (0, field_order - 1)]:
+        value = randrange(lower, upper + 1)
+        proof = Range(value, lower, upper).generate_proof()
+        assert verify_both_modes(proof, lower, upper)
+        assert not verify_both_modes(proof, lower + 1, upper)
+        assert not verify_both_modes(proof, lower, upper + 1)
+
+
+def test_verify_modes_agree_on_adversarial_proofs():
+    lower, upper = 18, 125
+    proof = Range(21, lower, upper).generate_proof()
+    other = Range(42, lower, upper).generate_proof()
+    points = ["Y", "D", "R", "W", "L", "A", "B", "ac", "bc"]
+    tampered = []
+    for key in points:
+        tampered.append({**proof, key: other[key]})
+        tampered.append({**proof, key: g1_identity})
+        tampered.append({**proof, key: g1_point(2)})
+    for a, b in [("Y", "W"), ("A", "B"), ("R", "L"), ("ac", "bc")]:
+        tampered.append({**proof, a: proof[b], b: proof[a]})
+    for key in ["Za", "Zb"]:
+        tampered.append({**proof, key: "00"})
+        tampered.append({**proof, key: other[key]})
+    # shifting Y and L by the same point keeps the range equation balanced
+    shift = G1Point.generator() * 7
+    tampered.append(
+        {
+            **proof,
+            "Y": (G1Point.from_hex(proof["Y"]) + shift).hex(),
+            "L": (G1Point.from_hex(proof["L"]) + shift).hex(),
+        }
+    )
+    for candidate in tampered:
+        verify_both_modes(candidate, lower, upper)
+
+
+def test_verify_unknown_mode():
+    proof = Range(21, 18, 125).generate_proof()
+    with pytest.raises(ValueError, match="Unknown verification mode"):
+        Range.verify_proof(proof, 18, 125, mode="slow")
+
+
+def test_verify_batch_all_valid():
+    jobs = []
+    for lower, upper in [(0, 0), (18, 25), (0, pow(2, 64) - 1), (20, 125)]:
+        value = randrange(lower, upper + 1)
+        jobs.append((Range(value, lower, upper).generate_proof(), lower, upper))
+    assert Range.verify_batch(jobs) == [True] * len(jobs)
+    assert Range.verify_batch(jobs, mode="fast") == [True] * len(jobs)
+    assert Range.verify_batch([]) == []
+
+
+def test_verify_batch_isolates_bad_proofs():
+    lower, upper = 0, pow(2, 64) - 1
+    jobs = []
+    for _ in range(8):
+        value = randrange(lower, upper)
+        jobs.append((Range(value, lower, upper).generate_proof(), lower, upper))
+    jobs[1] = (jobs[1][0], lower + 1, upper)
+    jobs[4] = ({**jobs[4][0], "W": jobs[0][0]["W"]}, lower, upper)
+    jobs[6] = ({**jobs[6][0], "Zb": "00"}, lower, upper)
+    jobs.append(({**jobs[0][0], "ac": "zz"}, lower, upper))
+    jobs.append(({}, lower, upper))
+    expected = [True] * 10
+    for index in [1, 4, 6, 8, 9]:
+        expected[index] = False
+    for mode in ["pairing", "fast"]:
+        assert Range.verify_batch(jobs, mode=mode) == expected
+
+
+def test_verify_rejects_points_outside_the_subgroup():
+    # on the curve, but not in the prime-order subgroup
+    outside = "80" + "00" * 46 + "04"
+    proof = Range(42, 0, 100).generate_proof()
+    tampered = {**proof, "W": outside}
+    for mode in ["pairing", "fast"]:
+        with pytest.raises(ValueError, match="subgroup"):
+            Range.verify_proof(tampered, 0, 100, mode=mode)
+        assert Range.verify_batch([(proof, 0, 100), (tampered, 0, 100)], mode) == [
+            True,
+            False,
+        ]
+
+
+def test_verify_rejects_padded_points(each_backend):
+    proof = Range(42, 0, 100).generate_proof()
+    # the on-chain uncompress only takes 48 bytes, a padded Y must fail
+    tampered = {**proof, "Y": "00" * 48 + proof["Y"]}
+    for mode in ["pairing", "fast"]:
+        with pytest.raises(ValueError, match="48 bytes"):
+            Range.verify_proof(tampered, 0, 100, mode=mode)
+        assert Range.verify_batch([(tampered, 0, 100)], mode) == [False]
+
+
+def test_proofs_are_bytes_with_a_hex_presentation():
+    proof = Range(42, 0, 100).create_proof()
+    assert all(isinstance(getattr(proof, key), bytes) for key in proof.to_dict())
+    assert len(proof.Y) == 48 and len(proof.ac) == 48
+    assert RangeProof.from_dict(proof.to_dict()) == proof
+    for mode in ["pairing", "fast"]:
+        assert Range.verify_proof(proof, 0, 100, mode=mode)
+        assert Range.verify_proof(proof.to_dict(), 0, 100, mode=mode)
+        assert Range.verify_batch(
+            [(proof, 0, 100), (proof.to_dict(), 0, 100)], mode
+        ) == [True, True]
+    assert not Range.verify_proof(proof, 1, 100)
+
+
+def test_generate_proofs_shares_the_interval():
+    lower, upper = 0, pow(2, 64) - 1
+    values = [lower, upper, randrange(lower, upper), 42]
+    proofs = Range.generate_proofs(values, lower, upper)
+    single = Range(42, lower, upper).generate_proof()
+    assert len(proofs) == 4
+    for proof in proofs:
+        assert proof.keys() == single.keys()
+        assert all(len(proof[key]) == len(single[key]) for key in ["Y", "D", "ac"])
+    assert Range.verify_batch([(proof, lower, upper) for proof in proofs]) == [True] * 4
+    assert not Range.verify_proof(proofs[3], lower + 1, upper)
+    streamed = list(Range.stream_proofs(iter(values), lower, upper, chunk_size=3))
+    assert (
+        Range.verify_batch([(proof, lower, upper) for proof in streamed]) == [True] * 4
+    )
+    assert Range.generate_proofs([], lower, upper) == []
+    with pytest.raises(ValueError, match="Y value"):
+        Range.generate_proofs([1, upper + 1], lower, upper)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+from src.range import Range
+from src.service import ProofService
+
+
+async def exchange(service: ProofService, requests: list[dict], **listen) -> dict:
+    server = await service.start(**listen)
+    async with server:
+        if "path" in listen:
+            reader, writer = await asyncio.open_unix_connection(listen["path"])
+        else:
+            reader, writer = await asyncio.open_connection(
+                *server.sockets[0].getsockname()[:2]
+            )
+        for request in requests:
+            writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        responses = {}
+        for _ in requests:
+            response = json.loads(await reader.readline())
+            responses[response["id"]] = response
+        writer.close()
+        return responses
+
+
+def test_prove_verify_and_batch_verify(tmp_path):
+    service = ProofService(workers=1, max_pending=2)
+    try:
+        proof = Range(42, 0, 100).generate_proof()
+        requests = [
+            {"id": 1, "op": "prove", "value": 7, "lower": 5, "upper": 10},
+            {"id": 2, "op": "prove", "value": 11, "lower": 5, "upper": 10},
+            {"id": 3, "op": "verify", "proof": proof, "lower": 0, "upper": 100},
+            {
+                "id": 4,
+                "op": "verify",
+                "proof": proof,
+                "lower": 1,
+                "upper": 100,
+                "mode": "fast",
+            },
+            {
+                "id": 5,
+                "op": "batch-verify",
+                "proofs": [
+                    {"proof": proof, "lower": 0, "upper": 100},
+                    {"proof": proof, "lower": 0, "upper": 99},
+                ],
+            },
+            {"id": 6, "op": "sign"},
+        ]
+        responses = asyncio.run(
+            exchange(service, requests, path=str(tmp_path / "zk.sock"))
+        )
+        assert responses[1]["ok"] and Range.verify_proof(responses[1]["proof"], 5, 10)
+        assert not responses[2]["ok"] and "Y value" in responses[2]["error"]
+        assert responses[3] == {"id": 3, "ok": True, "valid": True}
+        assert responses[4] == {"id": 4, "ok": True, "valid": False}
+        assert responses[5] == {"id": 5, "ok": True, "valid": [True, False]}
+        assert responses[6] == {
+            "id": 6,
+            "ok": False,
+            "error": "Unknown operation: sign",
+        }
+
+        responses = asyncio.run(exchange(service, requests[:1], port=0))
+        assert responses[1]["ok"]
+    finally:
+        service.close()
+
+
+async def idle_and_busy(service: ProofService, request: dict) -> dict:
+    server = await service.start(port=0)
+    async with server:
+        address = server.sockets[0].getsockname()[:2]
+        # a connected client that never sends anything must not hold a slot
+        _, idle = await asyncio.open_connection(*address)
+        reader, writer = await asyncio.open_connection(*address)
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await asyncio.wait_for(reader.readline(), 30))
+        writer.close()
+        idle.close()
+        return response
+
+
+def test_idle_connections_hold_no_slot():
+    service = ProofService(workers=1, max_pending=1)
+    try:
+        proof = Range(42, 0, 100).generate_proof()
+        request = {"id": 1, "op": "verify", "proof": proof, "lower": 0, "upper": 100}
+        response = asyncio.run(idle_and_busy(service, request))
+        assert response == {"id": 1, "ok": True, "valid": True}
+    finally:
+        service.close()
@@ -0,0 +1,63 @@
+import io
+import json
+
+from src.range import Range
+from zk_interval import batch
+
+
+def proof_of(datum: dict) -> dict:
+    points, upper_schnorr, lower_schnorr = (
+        field["fields"] for field in datum["fields"][:3]
+    )
+    keys = ["Y", "D", "R", "A", "B", "W", "L"]
+    proof = {key: field["bytes"] for key, field in zip(keys, points)}
+    proof["Za"], proof["ac"] = (field["bytes"] for field in upper_schnorr)
+    proof["Zb"], proof["bc"] = (field["bytes"] for field in lower_schnorr)
+    return proof
+
+
+def test_batch_writes_one_compact_datum_per_line():
+    rows = [(42, 0, 100), (420, 0, 100), (7, 5, 10), (2**63, 0, 2**64 - 1)]
+    jsonl = io.StringIO(
+        "".join(
+            json.dumps(dict(zip(["value", "lower", "upper"], row))) + "\n"
+            for row in rows
+        )
+    )
+    output = io.StringIO()
+    assert batch(jsonl, output, workers=1, chunk_size=2) == (3, 1)
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 3 and all(" " not in line for line in lines)
+    for line, (_, lower, upper) in zip(lines, [rows[0], rows[2], rows[3]]):
+        datum = json.loads(line)
+        assert datum["fields"][3:] == [{"int": upper}, {"int": lower}]
+        assert Range.verify_proof(proof_of(datum), lower, upper)
+
+    output = io.StringIO()
+    assert batch(
+        io.StringIO("value,lower,upper\n1,0,2\n"), output, csv_format=True, workers=1
+    ) == (1, 0)
+    assert Range.verify_proof(proof_of(json.loads(output.getvalue())), 0, 2)
+
+
+def test_batch_reports_malformed_rows_and_keeps_going(capsys):
+    jsonl = io.StringIO(
+        '{"value": 42, "lower": 0, "upper": 100}\n'
+        '{"value": "abc", "lower": 0, "upper": 100}\n'
+        '{"value": 1, "lower": 0}\n'
+        "not json\n"
+        '{"value": 7, "lower": 5, "upper": 10}\n'
+    )
+    output = io.StringIO()
+    assert batch(jsonl, output, workers=1) == (2, 3)
+    lines = output.getvalue().splitlines()
+    assert Range.verify_proof(proof_of(json.loads(lines[0])), 0, 100)
+    assert Range.verify_proof(proof_of(json.loads(lines[1])), 5, 10)
+    errors = capsys.readouterr().err
+    assert "row 2:" in errors and "row 3: missing 'upper'" in errors
+    assert "row 4:" in errors
+
+    output = io.StringIO()
+    csv_input = io.StringIO("value,lower,upper\n1,0,2\nx,0,2\n2,0\n")
+    assert batch(csv_input, output, csv_format=True, workers=1) == (1, 2)
+    assert "row 3:" in capsys.readouterr().err
@@ -1,7 +1,15 @@
 import argparse
+import asyncio
+import csv
 import json
+import sys
+import time
+from collections import deque
+from typing import Iterator, TextIO
 
-from src.range import Range
+from src.prover_pool import ProverPool
+from src.range import Range, RangeProof
+from src.service import ProofService
 from src.bls12_381 import curve_order
 
 
@@ -11,8 +19,15 @@ def save_proof_to_json(data: dict, file_path: str) -> None:
         json.dump(data, file, indent=4)
 
 
-def zk_data(proof: dict, lower: int, upper: int, file_path: str) -> None:
-    data = {
+def zk_data(proof: dict | RangeProof, lower: int, upper: int, file_path: str) -> None:
+    save_proof_to_json(datum(proof, lower, upper), file_path)
+
+
+def datum(proof: dict | RangeProof, lower: int, upper: int) -> dict:
+    # hex is only the presentation of the proof bytes
+    if isinstance(proof, RangeProof):
+        proof = proof.to_dict()
+    return {
         "constructor": 0,
         "fields": [
             {
@@ -39,16 +54,242 @@ def zk_data(proof: dict, lower: int, upper: int, file_path: str) -> None:
             {"int": lower},
         ],
     }
-    save_proof_to_json(data, file_path)
+
+
+def read_jobs(
+    file: TextIO, csv_format: bool
+) -> Iterator[tuple[int, tuple[int, int, int] | None, str | None]]:
+    """
+    Streams (value, lower, upper) rows from JSONL objects with value, lower
+    and upper keys, or from CSV with a value,lower,upper header. Each row comes
+    with its line number, and a row that cannot be parsed comes with its error
+    instead of a job.
+    """
+    if csv_format:
+        reader = csv.DictReader(file)
+        rows = ((reader.line_num, row) for row in reader)
+    else:
+        rows = ((number, line) for number, line in enumerate(file, 1) if line.strip())
+    for number, row in rows:
+        try:
+            if not csv_format:
+                row = json.loads(row)
+            yield number, (
+                int(row["value"]),
+                int(row["lower"]),
+                int(row["upper"]),
+            ), None
+        except KeyError as error:
+            yield number, None, f"missing {error}"
+        except (TypeError, ValueError) as error:
+            yield number, None, str(error)
+
+
+def batch(
+    input_file: TextIO,
+    output_file: TextIO,
+    csv_format: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 32,
+) -> tuple[int, int]:
+    """
+    Proves every row of the input and writes one compact zk_data datum per
+    line, in input order. Rows are read, proven and written as a stream, so
+    memory stays flat however long the input is. Rows that cannot be parsed or
+    proven are reported on stderr by line number and left out of the output.
+
+    Returns:
+        tuple[int, int]: The number of datums written and of failed rows.
+    """
+    jobs: deque[tuple[int, int, int]] = deque()
+    written = failed = 0
+
+    def report(number: int, error: str) -> None:
+        nonlocal failed
+        print(f"row {number}: {error}", file=sys.stderr)
+        failed += 1
+
+    def tracked() -> Iterator[tuple[int, int, int]]:
+        # keep the line and bounds of the jobs in flight for their datums,
+        # rows that do not parse never reach the pool
+        for number, job, error in read_jobs(input_file, csv_format):
+            if job is None:
+                report(number, error)
+                continue
+            jobs.append((number, job[1], job[2]))
+            yield job
+
+    with ProverPool(workers, chunk_size) as pool:
+        # results arrive in input order, the oldest job in flight is theirs
+        for result in pool.prove(tracked()):
+            number, lower, upper = jobs.popleft()
+            if result.error is None:
+                line = json.dumps(
+                    datum(result.proof, lower, upper), separators=(",", ":")
+                )
+                output_file.write(line + "\n")
+                written += 1
+            else:
+                report(number, result.error)
+    return written, failed
+
+
+def batch_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="zk_interval.py batch",
+        description=(
+            "Generate many range proofs from a JSONL or CSV file of value, lower and upper rows.\n\n"
+            "Example:\n"
+            "python3 zk_interval.py batch --input jobs.jsonl --output datums.jsonl"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=str,
+        required=True,
+        help="JSONL or CSV jobs, - for stdin",
+        metavar="INPUT",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        required=True,
+        help="JSONL datums, - for stdout",
+        metavar="OUTPUT",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        help="The input format, taken from the file extension by default",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Worker processes, defaults to the number of cores",
+        metavar="WORKERS",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=32,
+        help="Jobs sent to a worker at once",
+        metavar="CHUNK_SIZE",
+    )
+    args = parser.parse_args(argv)
+    csv_format = (args.format or args.input.rsplit(".", 1)[-1].lower()) == "csv"
+
+    input_file = sys.stdin if args.input == "-" else open(args.input, newline="")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w")
+    start = time.perf_counter()
+    try:
+        written, failed = batch(
+            input_file, output_file, csv_format, args.workers, args.chunk_size
+        )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    elapsed = time.perf_counter() - start
+    print(
+        f"Proved {written} datums in {elapsed:.2f} s "
+        f"({written / elapsed:.1f} proofs/s), {failed} failed",
+        file=sys.stderr,
+    )
+    if failed:
+        sys.exit(1)
+
+
+async def serve(
+    socket_path: str | None, host: str, port: int, workers: int | None, max_pending: int
+) -> None:
+    service = ProofService(workers, max_pending)
+    try:
+        server = await service.start(socket_path, host, port)
+        for address in [sock.getsockname() for sock in server.sockets]:
+            print(f"Serving on {address}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def serve_main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="zk_interval.py serve",
+        description=(
+            "Serve prove, verify and batch-verify requests, one JSON object per line, with warm precomputed state.\n\n"
+            "Example:\n"
+            "python3 zk_interval.py serve --socket /tmp/zk_interval.sock\n"
+            "python3 zk_interval.py serve --port 8765"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    listen = parser.add_mutually_exclusive_group(required=True)
+    listen.add_argument(
+        "-s",
+        "--socket",
+        type=str,
+        help="Unix socket path to listen on",
+        metavar="SOCKET",
+    )
+    listen.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        help="TCP port to listen on",
+        metavar="PORT",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="TCP host, localhost by default",
+        metavar="HOST",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Worker processes, defaults to the number of cores",
+        metavar="WORKERS",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=64,
+        help="Requests in flight before clients stop being read",
+        metavar="MAX_PENDING",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(
+            serve(args.socket, args.host, args.port, args.workers, args.max_pending)
+        )
+    except KeyboardInterrupt:
+        pass
 
 
 def main() -> None:
+    if sys.argv[1:2] == ["batch"]:
+        batch_main(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["serve"]:
+        serve_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description=(
             "Generate a range proof based on a value, lower bound, and upper bound.\n\n"
             "Example:\n"
             "python3 zk_interval.py -v 42 -l 0 -u 100 -f datum.json\n"
-            "python3 zk_interval.py --value 42 --lower 0 --upper 100 --file_path datum.json"
+            "python3 zk_interval.py --value 42 --lower 0 --upper 100 --file_path datum.json\n"
+            "python3 zk_interval.py batch --input jobs.jsonl --output datums.jsonl\n"
+            "python3 zk_interval.py serve --socket /tmp/zk_interval.sock"
         ),
         formatter_class=argparse.RawTextHelpFormatter,  # Preserve formatting
         epilog=(
@@ -99,7 +340,7 @@ def main() -> None:
 
     r = Range(secret_value=args.value, lower_bound=args.lower, upper_bound=args.upper)
 
-    proof = r.generate_proof()
+    proof = r.create_proof()
 
     print(f"Is the Proof Valid? {r.verify_proof(proof, args.lower, args.upper)}")
 